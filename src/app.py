@@ -39,8 +39,8 @@ class NuitkaGUI(QMainWindow):
         # Create menu bar
         self.create_menu_bar()
 
-        # Check if Nuitka is installed
-        self.check_nuitka()
+        # Report Nuitka availability once the background probe finishes
+        self.main_window.nuitkaDetected.connect(self.check_nuitka)
 
     def create_menu_bar(self):
         """Create application menu bar with keyboard shortcuts."""
@@ -156,9 +156,9 @@ class NuitkaGUI(QMainWindow):
         docs_action.triggered.connect(self.open_nuitka_docs)
         help_menu.addAction(docs_action)
 
-    def check_nuitka(self):
-        """Check if Nuitka is installed."""
-        if not PlatformDetector.has_nuitka():
+    def check_nuitka(self, installed, version):
+        """Report the result of the Nuitka detection probe."""
+        if not installed:
             QMessageBox.warning(
                 self,
                 "Nuitka Not Found",
@@ -168,7 +168,6 @@ class NuitkaGUI(QMainWindow):
                 "You can still configure compilations, but cannot run them."
             )
         else:
-            version = PlatformDetector.get_nuitka_version()
             self.main_window.update_status(f"Nuitka {version} detected")
 
     def on_compile(self):
@@ -18,6 +18,17 @@ class ConfigManager:
         """Initialize configuration with default values."""
         self._config = self._get_default_config()
         self._file_path = None
+        self._version = 0
+
+    @property
+    def version(self):
+        """
+        Monotonic counter bumped whenever the configuration changes.
+
+        Returns:
+            int: Current configuration version
+        """
+        return self._version
 
     def _get_default_config(self):
         """Get default configuration structure."""
@@ -173,8 +184,54 @@ class ConfigManager:
                 config[k] = {}
             config = config[k]
 
-        # Set the value
+        # Set the value (no-op writes keep the version unchanged)
+        if keys[-1] in config and config[keys[-1]] == value:
+            return
         config[keys[-1]] = value
+        self._version += 1
+
+    def update(self, values):
+        """
+        Set several configuration values at once.
+
+        Args:
+            values: Mapping of dot-notation keys to values
+
+        Returns:
+            bool: True if any value changed
+        """
+        version = self._version
+        for key, value in values.items():
+            self.set(key, value)
+        if self._version == version:
+            return False
+        # A batch counts as a single change
+        self._version = version + 1
+        return True
+
+    def snapshot(self, section):
+        """
+        Get all values under a section keyed by their full dot-notation key.
+
+        Values are not copied, so callers must treat them as read-only.
+
+        Args:
+            section: Top-level or dotted section key (e.g., 'advanced')
+
+        Returns:
+            dict: Flat mapping of dot-notation keys to values
+        """
+        values = {}
+        pending = [(section, self.get(section))]
+        while pending:
+            prefix, node = pending.pop()
+            if not isinstance(node, dict):
+                continue
+            for name, value in node.items():
+                key = f"{prefix}.{name}"
+                values[key] = value
+                pending.append((key, value))
+        return values
 
     def save(self, filepath):
         """
@@ -229,6 +286,7 @@ class ConfigManager:
                 self._get_default_config(),
                 loaded_config
             )
+            self._version += 1
 
             self._file_path = filepath
             return True
@@ -269,6 +327,7 @@ class ConfigManager:
         """Reset configuration to defaults."""
         self._config = self._get_default_config()
         self._file_path = None
+        self._version += 1
 
     def to_dict(self):
         """
@@ -5,12 +5,19 @@ import sys
 import platform
 import shutil
 import subprocess
+import threading
+
+# Version strings reported when Nuitka cannot be run
+_NUITKA_MISSING = ("Unknown", "Not installed")
 
 
 class PlatformDetector:
     """Detects platform and available compilers."""
 
     _cached_platform = None
+    _cached_default_compiler = None
+    _cached_nuitka_version = None
+    _nuitka_lock = threading.Lock()
 
     @staticmethod
     def get_platform():
@@ -67,31 +74,31 @@ class PlatformDetector:
     @staticmethod
     def get_default_compiler():
         """Get the default recommended compiler for this platform."""
-        if PlatformDetector.is_windows():
-            return 'msvc' if shutil.which('cl') else 'mingw64'
-        else:
-            return 'auto'
+        if PlatformDetector._cached_default_compiler is None:
+            if PlatformDetector.is_windows():
+                PlatformDetector._cached_default_compiler = 'msvc' if shutil.which('cl') else 'mingw64'
+            else:
+                PlatformDetector._cached_default_compiler = 'auto'
+        return PlatformDetector._cached_default_compiler
 
     @staticmethod
     def has_nuitka():
-        """Check if Nuitka is installed."""
-        try:
-            result = subprocess.run(
-                [sys.executable, '-m', 'nuitka', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, PermissionError):
-            return False
-        except subprocess.SubprocessError:
-            # Log unexpected subprocess errors if needed
-            return False
+        """Check if Nuitka is installed (shares the cached version query)."""
+        return PlatformDetector.get_nuitka_version() not in _NUITKA_MISSING
 
     @staticmethod
     def get_nuitka_version():
-        """Get Nuitka version string."""
+        """Get Nuitka version string (resolved once per process)."""
+        if PlatformDetector._cached_nuitka_version is None:
+            # Callers on other threads wait for the query already in flight
+            with PlatformDetector._nuitka_lock:
+                if PlatformDetector._cached_nuitka_version is None:
+                    PlatformDetector._cached_nuitka_version = PlatformDetector._query_nuitka_version()
+        return PlatformDetector._cached_nuitka_version
+
+    @staticmethod
+    def _query_nuitka_version():
+        """Run Nuitka to query its version string."""
         try:
             result = subprocess.run(
                 [sys.executable, '-m', 'nuitka', '--version'],
@@ -85,6 +85,6 @@ def apply_preset(config, preset: PresetDefinition) -> List[Tuple[str, object, ob
     for key, value in preset.applies:
         old_value = config.get(key)
         if old_value != value:
-            config.set(key, value)
             changes.append((key, old_value, value))
+    config.update({key: value for key, _, value in changes})
     return changes
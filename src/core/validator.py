@@ -1,8 +1,17 @@
 """
 Input validation utilities for Nuitka GUI.
 """
+import os
 import re
-from pathlib import Path
+import stat
+
+
+def _stat_mode(path):
+    """Get a path's st_mode with a single stat call, or None if missing."""
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
 
 
 class Validator:
@@ -22,11 +31,11 @@ class Validator:
         if not path:
             return False, "File path is required"
 
-        p = Path(path)
-        if not p.exists():
+        mode = _stat_mode(path)
+        if mode is None:
             return False, f"File does not exist: {path}"
 
-        if not p.is_file():
+        if not stat.S_ISREG(mode):
             return False, f"Path is not a file: {path}"
 
         return True, ""
@@ -45,11 +54,11 @@ class Validator:
         if not path:
             return False, "Directory path is required"
 
-        p = Path(path)
-        if not p.exists():
+        mode = _stat_mode(path)
+        if mode is None:
             return False, f"Directory does not exist: {path}"
 
-        if not p.is_dir():
+        if not stat.S_ISDIR(mode):
             return False, f"Path is not a directory: {path}"
 
         return True, ""
@@ -193,7 +202,7 @@ class Validator:
 
         # Validate output directory if specified
         output_dir = config.get('basic.output_dir')
-        if output_dir and not Path(output_dir).exists():
+        if output_dir and _stat_mode(output_dir) is None:
             warnings.append(f"Output directory '{output_dir}' will be created")
 
         # Validate version numbers
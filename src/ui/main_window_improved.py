@@ -4,15 +4,20 @@ Improved main window with engineer-focused instrument panel UI (PySide6).
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTabWidget,
     QPlainTextEdit, QSplitter, QFrame, QLineEdit, QComboBox, QListWidget,
-    QStackedWidget, QTableWidget, QTableWidgetItem, QSizePolicy, QApplication
+    QStackedWidget, QTableView, QSizePolicy, QApplication
+)
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, QUrl, Signal
+from PySide6.QtGui import (
+    QPainter, QColor, QDesktopServices, QPixmap, QStandardItem, QStandardItemModel
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QColor, QDesktopServices, QUrl
 import platform
+import os
 import sys
+from itertools import islice
 from pathlib import Path
 import hashlib
 
+from .styles import get_theme_manager
 from .tab_data_driven import DataDrivenTab
 from ..core.flag_plan import compile_flag_plan, render_command_string
 from ..core.diffing import diff_flag_plans
@@ -21,10 +26,28 @@ from ..core.presets import apply_preset, get_preset
 from ..core.platform_detector import PlatformDetector
 from ..utils.constants import APP_NAME
 
+# Maximum number of artifact rows inserted per event-loop tick
+ARTIFACT_ROWS_PER_SLICE = 100
+
+# Quiet period after the last setting change before the flag plan and
+# command preview are recomputed, so typing does not recompile per keystroke
+PLAN_REFRESH_DELAY_MS = 200
+
+# Quiet period after the last keystroke in the settings search box before
+# the current tab is filtered
+SEARCH_FILTER_DELAY_MS = 150
+
+# Delay after first show before unopened settings tabs are built in the
+# background, one per event-loop pass
+TAB_PREFETCH_DELAY_MS = 500
+
 
 class StatusIndicator(QWidget):
     """Custom widget for drawing a colored status circle."""
 
+    # Antialiased dots rendered once per (color, device pixel ratio)
+    _pixmap_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(10, 10)
@@ -35,18 +58,97 @@ class StatusIndicator(QWidget):
         self.color = QColor(color_hex)
         self.update()
 
+    def _dot_pixmap(self):
+        """Return the cached pixmap for the current color."""
+        ratio = self.devicePixelRatioF()
+        key = (self.color.rgba(), ratio)
+        pixmap = StatusIndicator._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(10 * ratio), round(10 * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(self.color)
+            painter.setPen(Qt.NoPen)
+            painter.drawEllipse(1, 1, 8, 8)
+            painter.end()
+            StatusIndicator._pixmap_cache[key] = pixmap
+        return pixmap
+
     def paintEvent(self, event):
         """Paint the status circle."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(self.color)
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(1, 1, 8, 8)
+        painter.drawPixmap(0, 0, self._dot_pixmap())
+
+
+class _EnvironmentProbeSignals(QObject):
+    """Signals for reporting environment probe results."""
+
+    finished = Signal(bool, str, str)
+
+
+class _EnvironmentProbe(QRunnable):
+    """Resolve the Nuitka version and default compiler off the UI thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _EnvironmentProbeSignals()
+
+    def run(self):
+        """Query the (cached) platform details and report them."""
+        self.signals.finished.emit(
+            PlatformDetector.has_nuitka(),
+            PlatformDetector.get_nuitka_version(),
+            PlatformDetector.get_default_compiler(),
+        )
+
+
+def _hash_file(path: str) -> str:
+    """Return a short SHA-256 digest of a file, or "unreadable"."""
+    hasher = hashlib.sha256()
+    try:
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(8192), b""):
+                hasher.update(chunk)
+    except OSError:
+        return "unreadable"
+    return hasher.hexdigest()[:12]
+
+
+class _ArtifactHashSignals(QObject):
+    """Signals for reporting artifact hashes."""
+
+    hashed = Signal(int, str, str)  # (generation, path, digest)
+    done = Signal()
+
+
+class _ArtifactHashJob(QRunnable):
+    """Hash one slice of artifact files off the UI thread."""
+
+    def __init__(self, generation, paths):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _ArtifactHashSignals()
+        self.generation = generation
+        self.paths = paths
+        self.cancelled = False
+
+    def run(self):
+        """Hash each file, reporting results one at a time."""
+        for path in self.paths:
+            if self.cancelled:
+                break
+            self.signals.hashed.emit(self.generation, path, _hash_file(path))
+        self.signals.done.emit()
 
 
 class MainWindow(QWidget):
     """Improved main window with instrument panel UX/UI."""
 
+    nuitkaDetected = Signal(bool, str)  # (installed, version) once the probe finishes
+
     def __init__(self, parent, config, app):
         super().__init__(parent)
         self.config = config
@@ -57,7 +159,23 @@ class MainWindow(QWidget):
         self.tab_labels = [tab.get("label") for tab in self.registry.get_tabs()]
         self.current_plan = None
         self.last_success_plan = None
+        self._last_command_text = ""
+        self._artifact_rows = None
+        # Artifact listing generation; hash results from older listings are dropped
+        self._artifact_generation = 0
+        self._hash_items = {}  # file path -> hash column item awaiting its digest
+        self._hash_jobs = {}  # signals -> running job, kept alive until it finishes
+        self._last_config_version = None
         self._loading = False
+        self._tab_prefetch_scheduled = False
+        self._plan_refresh_timer = QTimer(self)
+        self._plan_refresh_timer.setSingleShot(True)
+        self._plan_refresh_timer.setInterval(PLAN_REFRESH_DELAY_MS)
+        self._plan_refresh_timer.timeout.connect(self.refresh_flag_plan)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_FILTER_DELAY_MS)
+        self._search_timer.timeout.connect(self.apply_search_filter)
 
         self.create_ui()
         self.load_from_config()
@@ -107,9 +225,7 @@ class MainWindow(QWidget):
         layout.setContentsMargins(12, 10, 12, 10)
         layout.setSpacing(10)
 
-        left = QWidget()
-        left_layout = QHBoxLayout(left)
-        left_layout.setContentsMargins(0, 0, 0, 0)
+        left_layout = QHBoxLayout()
         left_layout.setSpacing(10)
 
         app_label = QLabel(APP_NAME)
@@ -135,11 +251,9 @@ class MainWindow(QWidget):
         self.profile_combo.setMinimumWidth(120)
         left_layout.addWidget(self.profile_combo)
 
-        layout.addWidget(left, 2)
+        layout.addLayout(left_layout, 2)
 
-        center = QWidget()
-        center_layout = QHBoxLayout(center)
-        center_layout.setContentsMargins(0, 0, 0, 0)
+        center_layout = QHBoxLayout()
         center_layout.setSpacing(8)
 
         preset_label = QLabel("Preset")
@@ -163,11 +277,9 @@ class MainWindow(QWidget):
         apply_btn.clicked.connect(self.apply_preset_placeholder)
         center_layout.addWidget(apply_btn)
 
-        layout.addWidget(center, 2)
+        layout.addLayout(center_layout, 2)
 
-        right = QWidget()
-        right_layout = QHBoxLayout(right)
-        right_layout.setContentsMargins(0, 0, 0, 0)
+        right_layout = QHBoxLayout()
         right_layout.setSpacing(6)
 
         open_btn = QPushButton("Open Config")
@@ -199,7 +311,8 @@ class MainWindow(QWidget):
         help_btn.clicked.connect(self.app.open_nuitka_docs)
         right_layout.addWidget(help_btn)
 
-        layout.addWidget(right, 1, Qt.AlignRight)
+        layout.addLayout(right_layout, 1)
+        layout.setAlignment(right_layout, Qt.AlignRight)
 
         return header
 
@@ -221,28 +334,26 @@ class MainWindow(QWidget):
         layout.addStretch(1)
 
         python_exe = sys.executable
-        nuitka_version = PlatformDetector.get_nuitka_version()
         os_arch = f"{platform.system()} / {platform.machine()}"
-        compiler = PlatformDetector.get_default_compiler()
 
         env_label = QLabel(f"Python: {python_exe}")
         env_label.setProperty("class", "muted")
         layout.addWidget(env_label)
 
-        nuitka_label = QLabel(nuitka_version)
-        nuitka_label.setProperty("class", "muted")
-        layout.addWidget(nuitka_label)
+        self.nuitka_label = QLabel("Nuitka: (detecting…)")
+        self.nuitka_label.setProperty("class", "muted")
+        layout.addWidget(self.nuitka_label)
 
         os_label = QLabel(os_arch)
         os_label.setProperty("class", "muted")
         layout.addWidget(os_label)
 
-        compiler_label = QLabel(f"Compiler: {compiler}")
-        compiler_label.setProperty("class", "muted")
-        layout.addWidget(compiler_label)
+        self.compiler_label = QLabel("Compiler: (detecting…)")
+        self.compiler_label.setProperty("class", "muted")
+        layout.addWidget(self.compiler_label)
 
         self.repro_label = QLabel("Repro: Floating")
-        self.repro_label.setProperty("class", "pill")
+        self.repro_label.setObjectName("pill")
         layout.addWidget(self.repro_label)
 
         self.warnings_btn = QPushButton("Warnings: 0")
@@ -250,8 +361,19 @@ class MainWindow(QWidget):
         self.warnings_btn.clicked.connect(self.focus_diagnostics)
         layout.addWidget(self.warnings_btn)
 
+        # Nuitka/compiler detection shells out; resolve it on a worker thread
+        self._env_probe = _EnvironmentProbe()
+        self._env_probe.signals.finished.connect(self._apply_environment_info)
+        QThreadPool.globalInstance().start(self._env_probe)
+
         return strip
 
+    def _apply_environment_info(self, has_nuitka, nuitka_version, compiler):
+        """Update status strip labels once environment detection finishes."""
+        self.nuitka_label.setText(f"Nuitka: {nuitka_version}")
+        self.compiler_label.setText(f"Compiler: {compiler}")
+        self.nuitkaDetected.emit(has_nuitka, nuitka_version)
+
     def create_left_nav(self):
         """Create the navigation panel with tabs and section index."""
         panel = QFrame()
@@ -359,6 +481,8 @@ class MainWindow(QWidget):
 
         self.console_tabs = QTabWidget()
         self.console_tabs.setObjectName("consoleTabs")
+        theme_manager = get_theme_manager()
+        theme_manager.apply_scoped_stylesheet(self.console_tabs, {"tabs"})
         layout.addWidget(self.console_tabs, 1)
 
         self.console_tabs.addTab(self.create_command_tab(), "Command")
@@ -367,16 +491,14 @@ class MainWindow(QWidget):
         self.console_tabs.addTab(self.create_diagnostics_tab(), "Diagnostics")
         self.console_tabs.addTab(self.create_artifacts_tab(), "Artifacts")
 
-        footer = QWidget()
-        footer_layout = QHBoxLayout(footer)
-        footer_layout.setContentsMargins(0, 0, 0, 0)
+        footer_layout = QHBoxLayout()
 
         self.build_status_label = QLabel("Build: Idle | Exit code: -")
         self.build_status_label.setProperty("class", "muted")
         footer_layout.addWidget(self.build_status_label)
         footer_layout.addStretch(1)
 
-        layout.addWidget(footer)
+        layout.addLayout(footer_layout)
 
         return dock
 
@@ -482,16 +604,33 @@ class MainWindow(QWidget):
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self.artifacts_table = QTableWidget(0, 4)
-        self.artifacts_table.setHorizontalHeaderLabels(
+        self.artifacts_model = QStandardItemModel(0, 4, panel)
+        self.artifacts_model.setHorizontalHeaderLabels(
             ["File", "Size", "Hash", "Timestamp"]
         )
+        self.artifacts_table = QTableView()
+        self.artifacts_table.setModel(self.artifacts_model)
         self.artifacts_table.horizontalHeader().setStretchLastSection(True)
         self.artifacts_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self.artifacts_table, 1)
 
         return panel
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._tab_prefetch_scheduled:
+            self._tab_prefetch_scheduled = True
+            QTimer.singleShot(TAB_PREFETCH_DELAY_MS, self._prefetch_next_tab)
+
+    def _prefetch_next_tab(self):
+        """Build the next unopened settings tab, then yield to the event loop."""
+        pending = [tab for tab in self.tabs if not tab.is_built]
+        if not pending:
+            return
+        pending[0].ensure_built()
+        if len(pending) > 1:
+            QTimer.singleShot(0, self._prefetch_next_tab)
+
     def set_current_tab(self, index):
         """Switch stacked tab and update section index."""
         if index < 0:
@@ -521,6 +660,7 @@ class MainWindow(QWidget):
 
     def set_command_preview(self, command_text):
         """Update the command preview panel."""
+        self._last_command_text = command_text
         self.command_text.setPlainText(command_text)
 
     def set_build_result(self, status_text, exit_code):
@@ -528,7 +668,11 @@ class MainWindow(QWidget):
         self.build_status_label.setText(f"Build: {status_text} | Exit code: {exit_code}")
 
     def append_output(self, text):
-        """Append text to logs panel."""
+        """Append text to logs panel.
+
+        Callers emitting several lines should join them and append once,
+        as each call is a separate document mutation.
+        """
         self.output_text.appendPlainText(text.rstrip())
         scrollbar = self.output_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
@@ -540,7 +684,7 @@ class MainWindow(QWidget):
     def update_status(self, message, status_type="info"):
         """Update status strip."""
         self.status_label.setText(message)
-        from .styles import theme_manager
+        theme_manager = get_theme_manager()
         colors = theme_manager.get_colors(theme_manager.current_theme)
         color_map = {
             "info": colors["info"],
@@ -567,7 +711,7 @@ class MainWindow(QWidget):
 
         # Load and apply theme preference
         theme_pref = self.config.get("app.theme", "light")
-        from .styles import theme_manager
+        theme_manager = get_theme_manager()
         qapp = QApplication.instance()
         if qapp:
             theme_manager.switch_theme(qapp, theme_pref)
@@ -585,24 +729,31 @@ class MainWindow(QWidget):
         """
         # Config is already up-to-date — DataDrivenTab._on_change()
         # writes to self.config immediately on every widget change.
+        # Flush a pending debounced refresh so previews match what is saved.
+        self.refresh_flag_plan()
 
     def copy_command(self):
         """Copy command preview to clipboard."""
-        command_text = self.command_text.toPlainText().strip()
+        self.refresh_flag_plan()
+        command_text = (self._last_command_text or "").strip()
         if not command_text:
             return
-        clipboard = QApplication.clipboard()
-        clipboard.setText(command_text)
+        QApplication.clipboard().setText(command_text)
         self.update_status("Command copied", "success")
 
     def on_setting_changed(self, key):
         """Handle setting change and refresh previews."""
         if self._loading:
             return
-        self.refresh_flag_plan()
+        self._plan_refresh_timer.start()
 
     def refresh_flag_plan(self):
         """Recompute flag plan and update previews."""
+        self._plan_refresh_timer.stop()
+        version = self.config.version
+        if version == self._last_config_version:
+            return
+        self._last_config_version = version
         self.current_plan = compile_flag_plan(self.config.to_dict(), self.registry)
         command = render_command_string(self.current_plan, python_exe=sys.executable)
         self.set_command_preview(command)
@@ -629,6 +780,7 @@ class MainWindow(QWidget):
         self.diff_text.setPlainText("\n".join(lines))
 
     def show_inspector_for_key(self, key):
+        self.refresh_flag_plan()
         definition = self.registry.get_setting(key)
         if not definition:
             self.inspector_body.setPlainText("No inspector data available.")
@@ -654,9 +806,14 @@ class MainWindow(QWidget):
         self.inspector_body.setPlainText("\n".join(details))
 
     def on_search_changed(self, text):
+        self._search_timer.start()
+
+    def apply_search_filter(self):
+        """Filter the current tab by the search box text."""
+        self._search_timer.stop()
         index = self.tab_stack.currentIndex()
         if 0 <= index < len(self.tabs):
-            self.tabs[index].filter_settings(text)
+            self.tabs[index].filter_settings(self.search_input.text())
 
     def set_last_success_plan(self, plan):
         self.last_success_plan = plan
@@ -681,41 +838,88 @@ class MainWindow(QWidget):
             self.append_output(f"Output folder not found: {path}\n")
 
     def populate_artifacts(self):
-        """Populate artifacts table with files in output directory."""
+        """Populate artifacts table with files in output directory.
+
+        Rows are streamed into the table a slice at a time from the event
+        loop so that large output trees do not freeze the window; file
+        hashes are computed on the thread pool and filled in as they arrive.
+        """
         base_path = self._resolve_output_dir()
 
-        self.artifacts_table.setRowCount(0)
+        self._artifact_generation += 1
+        self._hash_items = {}
+        for job in self._hash_jobs.values():
+            job.cancelled = True
+        self.artifacts_model.setRowCount(0)
         if not base_path.exists():
+            self._artifact_rows = None
             return
 
-        files = [p for p in base_path.rglob("*") if p.is_file()]
-        for path in files:
+        slice_pending = self._artifact_rows is not None
+        self._artifact_rows = self._build_artifact_rows(base_path)
+        if not slice_pending:
+            QTimer.singleShot(0, self._populate_artifacts_slice)
+
+    def _populate_artifacts_slice(self):
+        """Insert the next slice of artifact rows and reschedule if needed."""
+        if self._artifact_rows is None:
+            return
+        entries = list(islice(self._artifact_rows, ARTIFACT_ROWS_PER_SLICE))
+        for path, name, size, timestamp in entries:
+            hash_item = QStandardItem("(hashing…)")
+            self._hash_items[path] = hash_item
+            self.artifacts_model.appendRow(
+                [QStandardItem(name), QStandardItem(size), hash_item, QStandardItem(timestamp)]
+            )
+        if entries:
+            job = _ArtifactHashJob(self._artifact_generation, [entry[0] for entry in entries])
+            job.signals.hashed.connect(self._apply_artifact_hash)
+            job.signals.done.connect(self._on_hash_job_done)
+            self._hash_jobs[job.signals] = job
+            QThreadPool.globalInstance().start(job)
+
+        if len(entries) < ARTIFACT_ROWS_PER_SLICE:
+            self._artifact_rows = None
+        else:
+            QTimer.singleShot(0, self._populate_artifacts_slice)
+
+    def _on_hash_job_done(self):
+        """Release a finished hash job."""
+        self._hash_jobs.pop(self.sender(), None)
+
+    def _apply_artifact_hash(self, generation, path, digest):
+        """Fill in a file's hash column once its background job reports it."""
+        if generation == self._artifact_generation:
+            item = self._hash_items.pop(path, None)
+            if item is not None:
+                item.setText(digest)
+
+    def _build_artifact_rows(self, base_path: Path):
+        """Yield (path, file, size, timestamp) rows for files under base_path."""
+        pending = [str(base_path)]
+        while pending:
             try:
-                row = self.artifacts_table.rowCount()
-                self.artifacts_table.insertRow(row)
-                rel = str(path.relative_to(base_path))
-                stat_info = path.stat()
-                size = stat_info.st_size
-                mtime = stat_info.st_mtime
-                digest = self._hash_file(path)
-
-                self.artifacts_table.setItem(row, 0, QTableWidgetItem(rel))
-                self.artifacts_table.setItem(row, 1, QTableWidgetItem(str(size)))
-                self.artifacts_table.setItem(row, 2, QTableWidgetItem(digest))
-                self.artifacts_table.setItem(row, 3, QTableWidgetItem(str(mtime)))
-            except (OSError, PermissionError) as e:
-                # Skip files that become inaccessible during listing
+                with os.scandir(pending.pop()) as scan:
+                    entries = list(scan)
+            except OSError:
                 continue
-
-    def _hash_file(self, path: Path) -> str:
-        hasher = hashlib.sha256()
-        try:
-            with path.open("rb") as handle:
-                for chunk in iter(lambda: handle.read(8192), b""):
-                    hasher.update(chunk)
-        except OSError:
-            return "unreadable"
-        return hasher.hexdigest()[:12]
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    stat_info = entry.stat()
+                except OSError:
+                    # Skip files that become inaccessible during listing
+                    continue
+                yield (
+                    entry.path,
+                    os.path.relpath(entry.path, base_path),
+                    str(stat_info.st_size),
+                    str(stat_info.st_mtime),
+                )
 
     def focus_diagnostics(self):
         """Focus diagnostics tab."""
@@ -747,15 +951,14 @@ class MainWindow(QWidget):
         for tab in self.tabs:
             tab.load_from_config()
         self.refresh_flag_plan()
-        self.append_output(f"[preset] Applied preset: {preset.name}\n")
-        if changes:
-            for key, old, new in changes:
-                self.append_output(f"  - {key}: {old} -> {new}\n")
+        lines = [f"[preset] Applied preset: {preset.name}"]
+        lines += [f"  - {key}: {old} -> {new}" for key, old, new in changes]
+        self.append_output("\n".join(lines))
         self.console_tabs.setCurrentIndex(1)
 
     def toggle_theme(self):
         """Toggle between light and dark themes."""
-        from .styles import theme_manager
+        theme_manager = get_theme_manager()
 
         # Determine new theme
         current = theme_manager.current_theme
@@ -778,7 +981,7 @@ class MainWindow(QWidget):
 
     def _update_theme_icon(self):
         """Update theme toggle button icon."""
-        from .styles import theme_manager
+        theme_manager = get_theme_manager()
         theme = theme_manager.current_theme
 
         # Use moon icon for light mode (clicking will go to dark)
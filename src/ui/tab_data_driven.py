@@ -3,9 +3,11 @@ Data-driven settings tab.
 """
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QMargins, QTimer
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -23,10 +25,81 @@ from PySide6.QtWidgets import (
 )
 
 from .widgets import FileSelectFrame, ListBoxWithButtons, RiskBadge, ImpactTag, PluginPicker
-from ..core.setting_definitions import SettingRegistry
+from ..core.setting_definitions import SettingDefinition, SettingRegistry
 from ..core.platform_detector import PlatformDetector
 
 
+@dataclass(slots=True)
+class SettingControl:
+    type: str
+    widget: QWidget
+    group: Optional[QButtonGroup] = None
+    items: List[QCheckBox] = field(default_factory=list)
+    values: List[object] = field(default_factory=list)
+    buttons: Dict[object, QRadioButton] = field(default_factory=dict)
+    checked_value: object = None
+    selected: Dict[object, bool] = field(default_factory=dict)
+    indexes: Dict[object, int] = field(default_factory=dict)
+
+
+# Shared by every zero-margin row and option layout
+_NO_MARGINS = QMargins(0, 0, 0, 0)
+
+
+def _tight_layout(layout_cls, parent: Optional[QWidget] = None, spacing: int = 0):
+    """Create a box layout with no margins and the given spacing."""
+    layout = layout_cls(parent)
+    layout.setContentsMargins(_NO_MARGINS)
+    layout.setSpacing(spacing)
+    return layout
+
+
+def _set_combo(control: SettingControl, value):
+    index = control.indexes.get(value)
+    if index is not None:
+        control.widget.setCurrentIndex(index)
+
+
+def _set_radio(control: SettingControl, value):
+    button = control.buttons.get(value)
+    if button is not None:
+        button.setChecked(True)
+
+
+def _set_multi_check(control: SettingControl, value):
+    values = set(value or [])
+    for cb, option_value in zip(control.items, control.values):
+        cb.setChecked(option_value in values)
+
+
+# Value accessors per control type, each taking the SettingControl
+_GETTERS: Dict[str, Callable[[SettingControl], Any]] = {
+    "file": lambda c: c.widget.get_path(),
+    "directory": lambda c: c.widget.get_path(),
+    "text": lambda c: c.widget.text(),
+    "checkbox": lambda c: c.widget.isChecked(),
+    "combo": lambda c: c.widget.currentData(),
+    "spin": lambda c: c.widget.value(),
+    "radio": lambda c: c.checked_value,
+    "multi_check": lambda c: [value for value, checked in c.selected.items() if checked],
+    "list": lambda c: c.widget.get_items(),
+    "plugin_picker": lambda c: c.widget.get_items(),
+}
+
+_SETTERS: Dict[str, Callable[[SettingControl, Any], None]] = {
+    "file": lambda c, v: c.widget.set_path(v or ""),
+    "directory": lambda c, v: c.widget.set_path(v or ""),
+    "text": lambda c, v: c.widget.setText(v or ""),
+    "checkbox": lambda c, v: c.widget.setChecked(bool(v)),
+    "combo": _set_combo,
+    "spin": lambda c, v: c.widget.setValue(int(v or 0)),
+    "radio": _set_radio,
+    "multi_check": _set_multi_check,
+    "list": lambda c, v: c.widget.set_items(v or []),
+    "plugin_picker": lambda c, v: c.widget.set_items(v or []),
+}
+
+
 class DataDrivenTab(QWidget):
     settingChanged = Signal(str)
     explainRequested = Signal(str)
@@ -36,8 +109,15 @@ class DataDrivenTab(QWidget):
         self.config = config
         self.registry = registry
         self.tab_id = tab_id
-        self.controls: Dict[str, Dict[str, object]] = {}
+        self._platform = PlatformDetector.get_platform()
+        self.controls: Dict[str, SettingControl] = {}
         self.rows: Dict[str, QWidget] = {}
+        # Definition and case-folded search text per row, resolved once
+        # alongside the row; filtering walks the flat list in build order
+        self._definitions: Dict[str, Optional[SettingDefinition]] = {}
+        self._row_list: List[Tuple[QWidget, Optional[str]]] = []
+        # Last search query, applied to sections as they are built
+        self._filter_query = ""
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -50,47 +130,99 @@ class DataDrivenTab(QWidget):
         self.content_layout = QVBoxLayout(content)
         self.content_layout.setContentsMargins(20, 20, 20, 20)
         self.content_layout.setSpacing(16)
-
-        self._build_sections()
-        self.content_layout.addStretch(1)
+        self._pending_sections: Optional[List[Dict[str, object]]] = None
+        self._built = False
+        self._loading = False
 
         scroll.setWidget(content)
         main_layout.addWidget(scroll)
 
-    def _build_sections(self):
-        tab = self._get_tab_data()
-        if not tab:
+    @property
+    def is_built(self) -> bool:
+        """Whether every section of the tab has been built."""
+        return self._built
+
+    def showEvent(self, event):
+        if self._pending_sections is None:
+            # Paint the first section right away; the rest follow one per
+            # event-loop pass so input stays responsive in between
+            self._build_sections(1)
+            QTimer.singleShot(0, self, self._build_next_section)
+        super().showEvent(event)
+
+    def ensure_built(self):
+        """Build all remaining setting rows and load their values."""
+        self._build_sections()
+
+    def _build_next_section(self):
+        self._build_sections(1)
+        if not self._built:
+            QTimer.singleShot(0, self, self._build_next_section)
+
+    def _build_sections(self, count: Optional[int] = None):
+        """Build up to count pending sections (all by default) and load their values."""
+        if self._built:
+            return
+        if self._pending_sections is None:
+            tab = self._get_tab_data()
+            self._pending_sections = list(tab.get("sections", [])) if tab else []
+        pending = self._pending_sections
+        batch = pending[:count] if count is not None else list(pending)
+        del pending[:len(batch)]
+
+        first_new = len(self.controls)
+        first_row = len(self._row_list)
+        self.setUpdatesEnabled(False)
+        try:
+            for section in batch:
+                self._build_section(section)
+            if self._filter_query:
+                self._apply_filter(self._row_list[first_row:])
+            if not pending:
+                self.content_layout.addStretch(1)
+                self._built = True
+            self._load_values(list(self.controls)[first_new:])
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_section(self, section: Dict[str, object]):
+        all_settings = section.get("settings", [])
+        settings = [
+            setting for setting in all_settings
+            if self._platform_ok(setting.get("platform_constraints"))
+        ]
+        if all_settings and not settings:
+            # Every row targets another platform; skip the empty card
             return
 
-        for section in tab.get("sections", []):
-            section_frame = QFrame()
-            section_frame.setProperty("class", "card")
-            section_layout = QVBoxLayout(section_frame)
-            section_layout.setContentsMargins(12, 12, 12, 12)
-            section_layout.setSpacing(10)
+        section_frame = QFrame()
+        section_frame.setProperty("class", "card")
+        section_layout = QVBoxLayout(section_frame)
+        section_layout.setContentsMargins(12, 12, 12, 12)
+        section_layout.setSpacing(10)
 
-            title = QLabel(section.get("title", ""))
-            title.setProperty("class", "sectiontitle")
-            section_layout.addWidget(title)
+        title = QLabel(section.get("title", ""))
+        title.setProperty("class", "sectiontitle")
+        section_layout.addWidget(title)
 
-            for setting in section.get("settings", []):
-                if not self._platform_ok(setting.get("platform_constraints")):
-                    continue
-                row = self._build_setting_row(setting)
-                section_layout.addWidget(row)
-                key = setting.get("key", "")
-                if key:
-                    self.rows[key] = row
+        for setting in settings:
+            row = self._build_setting_row(setting)
+            section_layout.addWidget(row)
+            key = setting.get("key", "")
+            if key:
+                self.rows[key] = row
+                definition = self.registry.get_setting(key)
+                self._definitions[key] = definition
+                self._row_list.append((row, self._search_text(definition)))
 
-            self.content_layout.addWidget(section_frame)
+        self.content_layout.addWidget(section_frame)
 
     def _platform_ok(self, constraints: Optional[Dict[str, List[str]]]) -> bool:
         if not constraints:
             return True
         os_list = constraints.get("os")
         if os_list:
-            current = PlatformDetector.get_platform()
-            return current in os_list
+            return self._platform in os_list
         return True
 
     def _build_setting_row(self, setting: Dict[str, object]) -> QWidget:
@@ -101,14 +233,9 @@ class DataDrivenTab(QWidget):
         impacts = setting.get("impact", [])
 
         row = QFrame()
-        layout = QVBoxLayout(row)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(6)
+        layout = _tight_layout(QVBoxLayout, row, spacing=6)
 
-        top = QWidget()
-        top_layout = QHBoxLayout(top)
-        top_layout.setContentsMargins(0, 0, 0, 0)
-        top_layout.setSpacing(8)
+        top_layout = _tight_layout(QHBoxLayout, spacing=8)
 
         label_widget = QLabel(label)
         top_layout.addWidget(label_widget)
@@ -121,12 +248,9 @@ class DataDrivenTab(QWidget):
         explain_btn.clicked.connect(lambda: self.explainRequested.emit(key))
         top_layout.addWidget(explain_btn)
 
-        layout.addWidget(top)
+        layout.addLayout(top_layout)
 
-        meta = QWidget()
-        meta_layout = QHBoxLayout(meta)
-        meta_layout.setContentsMargins(0, 0, 0, 0)
-        meta_layout.setSpacing(6)
+        meta_layout = _tight_layout(QHBoxLayout, spacing=6)
 
         effect_label = QLabel(effect)
         effect_label.setProperty("class", "muted")
@@ -139,7 +263,7 @@ class DataDrivenTab(QWidget):
             meta_layout.addWidget(ImpactTag(tag))
 
         meta_layout.addStretch(1)
-        layout.addWidget(meta)
+        layout.addLayout(meta_layout)
 
         return row
 
@@ -153,90 +277,112 @@ class DataDrivenTab(QWidget):
                 self, "", mode="directory" if control_type == "directory" else "file",
                 file_types=control.get("file_types")
             )
-            widget.entry.textChanged.connect(lambda _, k=key: self._on_change(k))
-            self.controls[key] = {"type": control_type, "widget": widget}
+            widget.entry.textChanged.connect(partial(self._on_value_changed, key))
+            self.controls[key] = SettingControl(control_type, widget)
             return widget
 
         if control_type == "text":
             widget = QLineEdit()
-            widget.textChanged.connect(lambda _, k=key: self._on_change(k))
-            self.controls[key] = {"type": control_type, "widget": widget}
+            widget.textChanged.connect(partial(self._on_value_changed, key))
+            self.controls[key] = SettingControl(control_type, widget)
             return widget
 
         if control_type == "checkbox":
             widget = QCheckBox()
-            widget.stateChanged.connect(lambda _, k=key: self._on_change(k))
-            self.controls[key] = {"type": control_type, "widget": widget}
+            widget.stateChanged.connect(partial(self._on_value_changed, key))
+            self.controls[key] = SettingControl(control_type, widget)
             return widget
 
         if control_type == "combo":
             widget = QComboBox()
             options = control.get("options", [])
-            for opt in options:
-                widget.addItem(opt.get("label"), opt.get("value"))
-            widget.currentIndexChanged.connect(lambda _, k=key: self._on_change(k))
-            self.controls[key] = {"type": control_type, "widget": widget}
+            widget.addItems([opt.get("label") for opt in options])
+            indexes = {}
+            for index, opt in enumerate(options):
+                widget.setItemData(index, opt.get("value"))
+                indexes.setdefault(opt.get("value"), index)
+            widget.currentIndexChanged.connect(partial(self._on_value_changed, key))
+            self.controls[key] = SettingControl(control_type, widget, indexes=indexes)
             return widget
 
         if control_type == "spin":
             widget = QSpinBox()
             widget.setRange(control.get("min", 0), control.get("max", 999))
-            widget.valueChanged.connect(lambda _, k=key: self._on_change(k))
-            self.controls[key] = {"type": control_type, "widget": widget}
+            widget.valueChanged.connect(partial(self._on_value_changed, key))
+            self.controls[key] = SettingControl(control_type, widget)
             return widget
 
         if control_type == "radio":
             group_widget = QWidget()
-            group_layout = QVBoxLayout(group_widget)
-            group_layout.setContentsMargins(0, 0, 0, 0)
-            group_layout.setSpacing(4)
+            group_layout = _tight_layout(QVBoxLayout, group_widget, spacing=4)
             button_group = QButtonGroup(group_widget)
+            buttons = {}
             for opt in control.get("options", []):
                 rb = QRadioButton(opt.get("label"))
-                rb.setProperty("value", opt.get("value"))
-                rb.toggled.connect(lambda checked, k=key: checked and self._on_change(k))
+                rb.toggled.connect(partial(self._on_radio_toggled, key, opt.get("value")))
                 button_group.addButton(rb)
                 group_layout.addWidget(rb)
-            self.controls[key] = {
-                "type": control_type,
-                "widget": group_widget,
-                "group": button_group,
-            }
+                buttons.setdefault(opt.get("value"), rb)
+            self.controls[key] = SettingControl(
+                control_type, group_widget, group=button_group, buttons=buttons
+            )
             return group_widget
 
         if control_type == "multi_check":
             group_widget = QWidget()
-            group_layout = QVBoxLayout(group_widget)
-            group_layout.setContentsMargins(0, 0, 0, 0)
-            group_layout.setSpacing(4)
+            group_layout = _tight_layout(QVBoxLayout, group_widget, spacing=4)
             checkboxes = []
+            option_values = []
+            selected = {}
             for opt in control.get("options", []):
+                value = opt.get("value")
                 cb = QCheckBox(opt.get("label"))
-                cb.setProperty("value", opt.get("value"))
-                cb.stateChanged.connect(lambda _, k=key: self._on_change(k))
+                cb.toggled.connect(partial(self._on_check_toggled, key, value))
                 checkboxes.append(cb)
+                option_values.append(value)
                 group_layout.addWidget(cb)
-            self.controls[key] = {"type": control_type, "widget": group_widget, "items": checkboxes}
+                selected.setdefault(value, False)
+            self.controls[key] = SettingControl(
+                control_type, group_widget, items=checkboxes, values=option_values,
+                selected=selected
+            )
             return group_widget
 
         if control_type == "list":
             widget = ListBoxWithButtons(self, "", height=5)
-            widget.itemsChanged.connect(lambda k=key: self._on_change(k))
-            self.controls[key] = {"type": control_type, "widget": widget}
+            widget.itemsChanged.connect(partial(self._on_change, key))
+            self.controls[key] = SettingControl(control_type, widget)
             return widget
 
         if control_type == "plugin_picker":
             widget = PluginPicker(self)
-            widget.itemsChanged.connect(lambda k=key: self._on_change(k))
-            self.controls[key] = {"type": control_type, "widget": widget}
+            widget.itemsChanged.connect(partial(self._on_change, key))
+            self.controls[key] = SettingControl(control_type, widget)
             return widget
 
         widget = QLineEdit()
-        widget.textChanged.connect(lambda _, k=key: self._on_change(k))
-        self.controls[key] = {"type": "text", "widget": widget}
+        widget.textChanged.connect(partial(self._on_value_changed, key))
+        self.controls[key] = SettingControl("text", widget)
         return widget
 
+    def _on_radio_toggled(self, key: str, value, checked: bool):
+        # Track the checked option as it changes so reads never scan buttons
+        if checked:
+            self.controls[key].checked_value = value
+            self._on_change(key)
+
+    def _on_check_toggled(self, key: str, value, checked: bool):
+        # Keep the checked options (in option order) current as boxes toggle
+        self.controls[key].selected[value] = checked
+        self._on_change(key)
+
+    def _on_value_changed(self, key: str, *_):
+        # Slot for signals that carry the new value; it is re-read from the widget
+        self._on_change(key)
+
     def _on_change(self, key: str):
+        if self._loading:
+            return
         value = self.get_value(key)
         self.config.set(key, value)
         self.settingChanged.emit(key)
@@ -245,101 +391,68 @@ class DataDrivenTab(QWidget):
         control = self.controls.get(key)
         if not control:
             return None
-        control_type = control["type"]
-        widget = control["widget"]
-
-        if control_type in ("file", "directory"):
-            return widget.get_path()
-        if control_type == "text":
-            return widget.text()
-        if control_type == "checkbox":
-            return widget.isChecked()
-        if control_type == "combo":
-            return widget.currentData()
-        if control_type == "spin":
-            return widget.value()
-        if control_type == "radio":
-            for button in control["group"].buttons():
-                if button.isChecked():
-                    return button.property("value")
-            return None
-        if control_type == "multi_check":
-            values = []
-            for cb in control.get("items", []):
-                if cb.isChecked():
-                    values.append(cb.property("value"))
-            return values
-        if control_type == "list":
-            return widget.get_items()
-        if control_type == "plugin_picker":
-            return widget.get_items()
-        return None
+        getter = _GETTERS.get(control.type)
+        return getter(control) if getter else None
 
     def set_value(self, key: str, value):
         control = self.controls.get(key)
         if not control:
             return
-        control_type = control["type"]
-        widget = control["widget"]
-
-        if control_type in ("file", "directory"):
-            widget.set_path(value or "")
-        elif control_type == "text":
-            widget.setText(value or "")
-        elif control_type == "checkbox":
-            widget.setChecked(bool(value))
-        elif control_type == "combo":
-            index = widget.findData(value)
-            if index >= 0:
-                widget.setCurrentIndex(index)
-        elif control_type == "spin":
-            widget.setValue(int(value or 0))
-        elif control_type == "radio":
-            for button in control["group"].buttons():
-                if button.property("value") == value:
-                    button.setChecked(True)
-                    break
-        elif control_type == "multi_check":
-            values = set(value or [])
-            for cb in control.get("items", []):
-                cb.setChecked(cb.property("value") in values)
-        elif control_type == "list":
-            widget.set_items(value or [])
-        elif control_type == "plugin_picker":
-            widget.set_items(value or [])
+        setter = _SETTERS.get(control.type)
+        if setter:
+            setter(control, value)
 
     def load_from_config(self):
-        tab = self._get_tab_data()
-        if not tab:
-            return
-        for section in tab.get("sections", []):
-            for setting in section.get("settings", []):
-                key = setting.get("key", "")
-                if key:
-                    self.set_value(key, self.config.get(key))
+        # self.controls is the tab's field table, filled as sections are
+        # built; sections not built yet load their values when they are
+        self._load_values(self.controls)
+
+    def _load_values(self, keys):
+        values = {}
+        for section in {key.split(".", 1)[0] for key in keys}:
+            values.update(self.config.snapshot(section))
+        # Widgets echo every programmatic change back through _on_change;
+        # config already holds these values, so skip the round trip
+        self._loading = True
+        try:
+            for key in keys:
+                self.set_value(key, values.get(key))
+        finally:
+            self._loading = False
+
+    def _search_text(self, definition: Optional[SettingDefinition]) -> Optional[str]:
+        if not definition:
+            return None
+        flag_terms = []
+        for mapping in definition.flag_mapping:
+            flag = mapping.get("flag")
+            if flag:
+                flag_terms.append(flag)
+        return " ".join(
+            [
+                definition.key,
+                definition.label,
+                definition.description,
+                definition.effect,
+                " ".join(flag_terms),
+            ]
+        ).casefold()
 
     def filter_settings(self, query: str):
-        query = (query or "").strip().lower()
-        for key, row in self.rows.items():
-            definition = self.registry.get_setting(key)
-            if not definition:
-                row.setVisible(True)
-                continue
-            flag_terms = []
-            for mapping in definition.flag_mapping:
-                flag = mapping.get("flag")
-                if flag:
-                    flag_terms.append(flag)
-            haystack = " ".join(
-                [
-                    definition.key,
-                    definition.label,
-                    definition.description,
-                    definition.effect,
-                    " ".join(flag_terms),
-                ]
-            ).lower()
-            row.setVisible(query in haystack if query else True)
+        self._filter_query = (query or "").strip().casefold()
+        # One relayout for the whole pass, touching only rows that change
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_filter(self._row_list)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _apply_filter(self, rows: List[Tuple[QWidget, Optional[str]]]):
+        query = self._filter_query
+        for row, haystack in rows:
+            visible = query in haystack if query and haystack is not None else True
+            if row.isHidden() == visible:
+                row.setVisible(visible)
 
     def _get_tab_data(self) -> Optional[Dict[str, object]]:
         for tab in self.registry.get_tabs():
@@ -1,14 +1,35 @@
 """
 Custom reusable widgets for Nuitka GUI (PySide6 version).
 """
+from collections import Counter
+
 from PySide6.QtWidgets import (
     QWidget, QLabel, QLineEdit, QPushButton, QHBoxLayout, QVBoxLayout,
-    QListWidget, QFileDialog, QInputDialog, QAbstractItemView, QToolButton
+    QListWidget, QListView, QFileDialog, QInputDialog, QAbstractItemView, QToolButton
 )
-from PySide6.QtCore import Signal, Qt, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import Signal, QEvent, QPropertyAnimation, QEasingCurve, QStringListModel
 
 from ..utils.constants import COMMON_PLUGINS
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QStandardItem, QStandardItemModel
+
+# Qt's QWIDGETSIZE_MAX, the "no maximum" widget size
+_QWIDGETSIZE_MAX = 16777215
+
+
+def _on_model_changed(model, callback):
+    """Call callback whenever rows or their data change in model."""
+    for signal in (model.rowsInserted, model.rowsRemoved, model.rowsMoved,
+                   model.dataChanged, model.modelReset, model.layoutChanged):
+        signal.connect(callback)
+
+
+# Accessible descriptions for FileSelectFrame, per selection mode
+_ENTRY_DESCRIPTIONS = {
+    mode: f"Enter or browse for a {mode}" for mode in ('file', 'files', 'directory')
+}
+_BROWSE_DESCRIPTIONS = {
+    mode: f"Open {mode} selection dialog" for mode in ('file', 'files', 'directory')
+}
 
 
 class FileSelectFrame(QWidget):
@@ -30,24 +51,30 @@ class FileSelectFrame(QWidget):
 
         self.mode = mode
         self.file_types = file_types or 'All files (*.*)'
+        self.title = label
+        self._dialog = None
 
         # Layout
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
 
-        # Label
-        self.label = QLabel(label, self)
-        layout.addWidget(self.label)
+        # Label (skipped when empty, e.g. when the owning row already has one)
+        self.label = None
+        if label:
+            self.label = QLabel(label, self)
+            layout.addWidget(self.label)
 
         # Entry
         self.entry = QLineEdit(self)
         self.entry.setMinimumWidth(300)
-        self.entry.textChanged.connect(self.pathChanged.emit)
+        self.entry.textChanged.connect(self.pathChanged)
 
         # Accessibility: Set accessible names and descriptions
         self.entry.setAccessibleName(f"{label} path")
-        self.entry.setAccessibleDescription(f"Enter or browse for a {mode}")
+        self.entry.setAccessibleDescription(
+            _ENTRY_DESCRIPTIONS.get(mode) or f"Enter or browse for a {mode}"
+        )
 
         layout.addWidget(self.entry, 1)  # Stretch factor 1
 
@@ -57,37 +84,36 @@ class FileSelectFrame(QWidget):
 
         # Accessibility: Set accessible names for browse button
         self.browse_btn.setAccessibleName(f"Browse for {label}")
-        self.browse_btn.setAccessibleDescription(f"Open {mode} selection dialog")
+        self.browse_btn.setAccessibleDescription(
+            _BROWSE_DESCRIPTIONS.get(mode) or f"Open {mode} selection dialog"
+        )
 
         layout.addWidget(self.browse_btn)
 
+    def _file_dialog(self):
+        """Get this frame's file dialog, created and configured on first use."""
+        if self._dialog is None:
+            dialog = QFileDialog(self, f"Select {self.title}")
+            if self.mode == 'directory':
+                dialog.setFileMode(QFileDialog.Directory)
+                dialog.setOption(QFileDialog.ShowDirsOnly, True)
+            else:
+                dialog.setFileMode(
+                    QFileDialog.ExistingFiles if self.mode == 'files' else QFileDialog.ExistingFile
+                )
+                dialog.setNameFilters(self.file_types.split(';;'))
+            self._dialog = dialog
+        return self._dialog
+
     def _browse(self):
         """Handle browse button click."""
-        if self.mode == 'file':
-            path, _ = QFileDialog.getOpenFileName(
-                self,
-                f"Select {self.label.text()}",
-                "",
-                self.file_types
-            )
-            if path:
-                self.entry.setText(path)
-        elif self.mode == 'files':
-            paths, _ = QFileDialog.getOpenFileNames(
-                self,
-                f"Select {self.label.text()}",
-                "",
-                self.file_types
-            )
-            if paths:
-                self.entry.setText(';'.join(paths))
-        elif self.mode == 'directory':
-            path = QFileDialog.getExistingDirectory(
-                self,
-                f"Select {self.label.text()}"
-            )
-            if path:
-                self.entry.setText(path)
+        # Reusing one dialog skips re-initialising the native picker per click
+        dialog = self._file_dialog()
+        if not dialog.exec():
+            return
+        paths = dialog.selectedFiles()
+        if paths:
+            self.entry.setText(';'.join(paths) if self.mode == 'files' else paths[0])
 
     def get_path(self):
         """Get current path value."""
@@ -103,6 +129,12 @@ class ListBoxWithButtons(QWidget):
 
     itemsChanged = Signal()  # Signal emitted when items change
 
+    # Row height in pixels per (font key, device pixel ratio), measured on first use
+    _item_heights = {}
+
+    # Events after which the row height must be measured again
+    _RESIZE_EVENTS = frozenset({QEvent.FontChange, QEvent.StyleChange, QEvent.DevicePixelRatioChange})
+
     def __init__(self, parent, label, add_callback=None, height=6):
         """
         Initialize listbox with buttons.
@@ -122,17 +154,27 @@ class ListBoxWithButtons(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(4)
 
-        # Label
-        label_widget = QLabel(label, self)
-        layout.addWidget(label_widget)
-
-        # List widget
-        self.listbox = QListWidget(self)
+        # Label (skipped when empty, e.g. when the owning row already has one)
+        if label:
+            layout.addWidget(QLabel(label, self))
+
+        # List view backed by a string model so only visible rows are laid out
+        self.model = QStringListModel(self)
+        self.listbox = QListView(self)
+        self.listbox.setObjectName("listbox")
+        self.listbox.setModel(self.model)
+        # Python-side copy of the items, dropped whenever the model changes
+        self._items_cache = None
+        _on_model_changed(self.model, self._invalidate_items)
+        self.listbox.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.listbox.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        # Set approximate height
-        font_metrics = self.listbox.fontMetrics()
-        item_height = font_metrics.height() + 6  # padding
-        self.listbox.setMinimumHeight(height * item_height + 10)
+        self.listbox.setUniformItemSizes(True)
+        self.listbox.setLayoutMode(QListView.Batched)
+        self.listbox.setBatchSize(50)
+        # Set approximate height, re-measured when the font, style or screen changes
+        self._height_items = height
+        self._update_min_height()
+        self.listbox.installEventFilter(self)
 
         # Accessibility: Set accessible names and descriptions
         self.listbox.setAccessibleName(label)
@@ -182,56 +224,80 @@ class ListBoxWithButtons(QWidget):
 
     def _remove_selected(self):
         """Remove selected items."""
-        selected_items = self.listbox.selectedItems()
-        for item in selected_items:
-            row = self.listbox.row(item)
-            self.listbox.takeItem(row)
+        rows = sorted(
+            (index.row() for index in self.listbox.selectionModel().selectedRows()),
+            reverse=True,
+        )
+        for row in rows:
+            self.model.removeRows(row, 1)
         self.itemsChanged.emit()
 
     def add_item(self, item):
         """Add an item to the listbox."""
-        self.listbox.addItem(item)
+        row = self.model.rowCount()
+        self.model.insertRows(row, 1)
+        self.model.setData(self.model.index(row), item)
         self.itemsChanged.emit()
 
     def remove_item(self, item):
         """Remove an item from the listbox."""
-        items = self.listbox.findItems(item, Qt.MatchExactly)
-        for list_item in items:
-            row = self.listbox.row(list_item)
-            self.listbox.takeItem(row)
-        self.itemsChanged.emit()
+        self.set_items([existing for existing in self.model.stringList() if existing != item])
+
+    def _invalidate_items(self, *_):
+        self._items_cache = None
+
+    def _update_min_height(self):
+        """Size the list for the requested number of rows in its current font."""
+        key = (self.listbox.font().key(), self.listbox.devicePixelRatioF())
+        item_height = self._item_heights.get(key)
+        if item_height is None:
+            item_height = self.listbox.fontMetrics().height() + 6  # padding
+            self._item_heights[key] = item_height
+        self.listbox.setMinimumHeight(self._height_items * item_height + 10)
+
+    def eventFilter(self, watched, event):
+        """Recompute the minimum height when the list's font, style or DPR changes."""
+        if watched is self.listbox and event.type() in self._RESIZE_EVENTS:
+            self._update_min_height()
+        return super().eventFilter(watched, event)
 
     def get_items(self):
         """Get all items as a list."""
-        return [self.listbox.item(i).text() for i in range(self.listbox.count())]
+        if self._items_cache is None:
+            self._items_cache = self.model.stringList()
+        return list(self._items_cache)
 
     def set_items(self, items):
         """Set all items (replaces existing)."""
-        self.listbox.clear()
-        for item in items:
-            self.listbox.addItem(item)
+        self.model.setStringList(list(items))
         self.itemsChanged.emit()
 
     def clear(self):
         """Clear all items."""
-        self.listbox.clear()
+        self.model.setStringList([])
         self.itemsChanged.emit()
 
 
 class CollapsibleFrame(QWidget):
     """Widget that can be collapsed/expanded with smooth animation."""
 
-    def __init__(self, parent, title):
+    # Demi-bold toggle button font, derived from the button font on first use
+    _title_font = None
+
+    def __init__(self, parent, title, animated=True):
         """
         Initialize collapsible frame.
 
         Args:
             parent: Parent widget
             title: Frame title
+            animated: Animate collapse/expand; pass False for large content
+                to toggle visibility directly instead of relayouting per frame
         """
         super().__init__(parent)
 
         self.is_expanded = True
+        self.animated = animated
 
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -241,9 +307,11 @@ class CollapsibleFrame(QWidget):
         # Toggle button
         self.toggle_btn = QPushButton(f"▼ {title}", self)
         self.toggle_btn.setProperty("class", "secondary")
-        font = self.toggle_btn.font()
-        font.setWeight(QFont.DemiBold)
-        self.toggle_btn.setFont(font)
+        if CollapsibleFrame._title_font is None:
+            font = self.toggle_btn.font()
+            font.setWeight(QFont.DemiBold)
+            CollapsibleFrame._title_font = font
+        self.toggle_btn.setFont(CollapsibleFrame._title_font)
         self.toggle_btn.clicked.connect(self.toggle)
         self.toggle_btn.setFlat(True)
         main_layout.addWidget(self.toggle_btn)
@@ -258,29 +326,50 @@ class CollapsibleFrame(QWidget):
         self.animation = QPropertyAnimation(self.content, b"maximumHeight")
         self.animation.setDuration(200)
         self.animation.setEasingCurve(QEasingCurve.InOutCubic)
+        self.animation.finished.connect(self._on_animation_finished)
 
     def toggle(self):
-        """Toggle collapsed/expanded state with animation."""
+        """Toggle collapsed/expanded state, animated unless disabled."""
+        # Animating a frame that is not on screen would only churn layouts
+        animate = self.animated and self.isVisible()
         if self.is_expanded:
             # Collapse
-            self.animation.setStartValue(self.content.height())
-            self.animation.setEndValue(0)
-            self.animation.start()
+            start = self.content.height()
+            if animate and start > 0:
+                self.animation.setStartValue(start)
+                self.animation.setEndValue(0)
+                self.animation.start()
+            else:
+                self.animation.stop()
+                self.content.setVisible(False)
             text = self.toggle_btn.text()
             self.toggle_btn.setText(text.replace('▼', '▶'))
             self.is_expanded = False
         else:
             # Expand
-            self.content.setMaximumHeight(16777215)  # QWIDGETSIZE_MAX
+            self.content.setVisible(True)
+            self.content.setMaximumHeight(_QWIDGETSIZE_MAX)
             content_height = self.content.sizeHint().height()
-            self.content.setMaximumHeight(0)
-            self.animation.setStartValue(0)
-            self.animation.setEndValue(content_height)
-            self.animation.start()
+            if animate and content_height > 0:
+                self.content.setMaximumHeight(0)
+                self.animation.setStartValue(0)
+                self.animation.setEndValue(content_height)
+                self.animation.start()
+            else:
+                self.animation.stop()
             text = self.toggle_btn.text()
             self.toggle_btn.setText(text.replace('▶', '▼'))
             self.is_expanded = True
 
+    def _on_animation_finished(self):
+        """Settle the content once an animated toggle completes."""
+        if self.is_expanded:
+            # Lift the animation's height cap so the content can grow again
+            self.content.setMaximumHeight(_QWIDGETSIZE_MAX)
+        else:
+            # Hidden content drops out of size-hint propagation entirely
+            self.content.setVisible(False)
+
 
 class TooltipLabel(QLabel):
     """Label with built-in tooltip support (uses Qt's native tooltip system)."""
@@ -314,8 +403,7 @@ class RiskBadge(QLabel):
 
     def __init__(self, level, parent=None):
         super().__init__(level.title(), parent)
-        self.setProperty("class", "risk")
-        self.setProperty("risk", level)
+        self.setObjectName(f"risk_{level}")
 
 
 class ImpactTag(QLabel):
@@ -323,7 +411,7 @@ class ImpactTag(QLabel):
 
     def __init__(self, text, parent=None):
         super().__init__(text.title(), parent)
-        self.setProperty("class", "impact")
+        self.setObjectName("impact")
 
 
 class PluginPicker(QWidget):
@@ -341,12 +429,19 @@ class PluginPicker(QWidget):
         available_frame = QVBoxLayout()
         available_label = QLabel("Available")
         available_frame.addWidget(available_label)
-        self.available = QListWidget()
-        self.available.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        # The plugin catalogue is static: fill a model once, then attach it
+        plugin_items = []
         for plugin_name, description in COMMON_PLUGINS:
-            self.available.addItem(plugin_name)
-            item = self.available.item(self.available.count() - 1)
+            item = QStandardItem(plugin_name)
             item.setToolTip(description)
+            item.setEditable(False)
+            plugin_items.append(item)
+        self.available_model = QStandardItemModel(self)
+        self.available_model.invisibleRootItem().appendRows(plugin_items)
+        self.available = QListView()
+        self.available.setObjectName("listbox")
+        self.available.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.available.setModel(self.available_model)
         available_frame.addWidget(self.available, 1)
 
         buttons = QVBoxLayout()
@@ -365,30 +460,50 @@ class PluginPicker(QWidget):
         self.enabled = QListWidget()
         self.enabled.setSelectionMode(QAbstractItemView.ExtendedSelection)
         enabled_frame.addWidget(self.enabled, 1)
+        # Enabled-name counts, updated in step with every add and removal;
+        # the ordered list copy is dropped whenever the model changes
+        self._enabled_counts = Counter()
+        self._items_cache = None
+        _on_model_changed(self.enabled.model(), self._invalidate_items)
 
         layout.addLayout(available_frame, 1)
         layout.addLayout(buttons)
         layout.addLayout(enabled_frame, 1)
 
     def enable_selected(self):
-        selected = self.available.selectedItems()
-        existing = {self.enabled.item(i).text() for i in range(self.enabled.count())}
-        for item in selected:
-            if item.text() not in existing:
-                self.enabled.addItem(item.text())
-        self.itemsChanged.emit()
+        existing = self._enabled_counts
+        added = []
+        seen = set()
+        for index in self.available.selectionModel().selectedIndexes():
+            name = index.data()
+            if name not in existing and name not in seen:
+                seen.add(name)
+                added.append(name)
+        if added:
+            self.enabled.addItems(added)
+            existing.update(added)
+            self.itemsChanged.emit()
 
     def disable_selected(self):
         for item in self.enabled.selectedItems():
             row = self.enabled.row(item)
-            self.enabled.takeItem(row)
+            name = self.enabled.takeItem(row).text()
+            self._enabled_counts[name] -= 1
+            if self._enabled_counts[name] <= 0:
+                del self._enabled_counts[name]
         self.itemsChanged.emit()
 
     def set_items(self, items):
+        items = list(items)
         self.enabled.clear()
-        for item in items:
-            self.enabled.addItem(item)
+        self.enabled.addItems(items)
+        self._enabled_counts = Counter(items)
         self.itemsChanged.emit()
 
+    def _invalidate_items(self, *_):
+        self._items_cache = None
+
     def get_items(self):
-        return [self.enabled.item(i).text() for i in range(self.enabled.count())]
+        if self._items_cache is None:
+            self._items_cache = [self.enabled.item(i).text() for i in range(self.enabled.count())]
+        return list(self._items_cache)
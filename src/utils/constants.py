@@ -7,24 +7,24 @@ APP_VERSION = "1.0.0"
 APP_AUTHOR = "Nuitka GUI Tool"
 
 # Compilation modes
-MODES = [
+MODES = (
     ("Accelerated (Module)", "accelerated"),
     ("Standalone", "standalone"),
     ("One-File", "onefile"),
     ("App Bundle (macOS)", "app"),
-]
+)
 
 # Compiler options
-COMPILERS = [
+COMPILERS = (
     ("Auto-detect", "auto"),
     ("MSVC (Windows)", "msvc"),
     ("MinGW64", "mingw64"),
     ("Clang", "clang"),
     ("Zig", "zig"),
-]
+)
 
 # Python flags with descriptions
-PYTHON_FLAGS = [
+PYTHON_FLAGS = (
     ("isolated", "Ignore PYTHONPATH and user site-packages (-I)"),
     ("no_site", "Don't import site module (-S)"),
     ("no_asserts", "Disable assert statements (-O)"),
@@ -34,40 +34,40 @@ PYTHON_FLAGS = [
     ("static_hashes", "Disable hash randomization"),
     ("unbuffered", "Force unbuffered stdout/stderr (-u)"),
     ("dont_write_bytecode", "Don't write .pyc files (-B)"),
-]
+)
 
 # Console modes for Windows
-CONSOLE_MODES = [
+CONSOLE_MODES = (
     ("Auto", "auto"),
     ("Force Console", "force"),
     ("Disable Console", "disable"),
     ("Attach to Parent", "attach"),
-]
+)
 
 # Onefile temp directory modes
-ONEFILE_TEMP_MODES = [
+ONEFILE_TEMP_MODES = (
     ("Auto", "auto"),
     ("Temporary", "temporary"),
     ("Cached", "cached"),
-]
+)
 
 # File reference choices
-FILE_REFERENCE_CHOICES = [
+FILE_REFERENCE_CHOICES = (
     ("Runtime", "runtime"),
     ("Original", "original"),
     ("Frozen", "frozen"),
-]
+)
 
 # Progress bar modes
-PROGRESS_BAR_MODES = [
+PROGRESS_BAR_MODES = (
     ("Auto", "auto"),
     ("tqdm", "tqdm"),
     ("rich", "rich"),
     ("None", "none"),
-]
+)
 
 # Common Nuitka plugins
-COMMON_PLUGINS = [
+COMMON_PLUGINS = (
     ("anti-bloat", "Removes unnecessary imports from popular packages"),
     ("tk-inter", "Support for Tkinter applications"),
     ("numpy", "NumPy package support"),
@@ -80,14 +80,15 @@ COMMON_PLUGINS = [
     ("pmw-freezer", "Python MegaWidgets support"),
     ("pylint-warnings", "Pylint integration"),
     ("implicit-imports", "Auto-detect implicit imports"),
-]
+)
 
 # Anti-bloat options
+_ANTI_BLOAT_CHOICES = (("Allow", "allow"), ("Error", "error"), ("Warning", "warning"), ("Ignore", "ignore"))
 ANTI_BLOAT_OPTIONS = {
-    "setuptools": [("Allow", "allow"), ("Error", "error"), ("Warning", "warning"), ("Ignore", "ignore")],
-    "pytest": [("Allow", "allow"), ("Error", "error"), ("Warning", "warning"), ("Ignore", "ignore")],
-    "unittest": [("Allow", "allow"), ("Error", "error"), ("Warning", "warning"), ("Ignore", "ignore")],
-    "IPython": [("Allow", "allow"), ("Error", "error"), ("Warning", "warning"), ("Ignore", "ignore")],
+    "setuptools": _ANTI_BLOAT_CHOICES,
+    "pytest": _ANTI_BLOAT_CHOICES,
+    "unittest": _ANTI_BLOAT_CHOICES,
+    "IPython": _ANTI_BLOAT_CHOICES,
 }
 
 # Window size
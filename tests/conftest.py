@@ -1,35 +1,95 @@
 """Pytest configuration and fixtures."""
+import copy
+import os
+import sys
+
 import pytest
 
+from src.core.config import ConfigManager
+from src.core.platform_detector import PlatformDetector
+
+
+@pytest.fixture(scope="session")
+def _config_template():
+    """Build the default ConfigManager once per session."""
+    return ConfigManager()
+
+
+@pytest.fixture
+def fresh_config(_config_template):
+    """Provide a pristine ConfigManager copied from the session template."""
+    return copy.deepcopy(_config_template)
+
+
+@pytest.fixture
+def make_config(_config_template):
+    """
+    Provide a factory for fresh configs with overrides applied.
+
+    Keyword names use ``__`` for the dots of a config key, e.g.
+    ``make_config(basic__mode="onefile")``.
+    """
+    def _make(**overrides):
+        config = copy.deepcopy(_config_template)
+        for key, value in overrides.items():
+            config.set(key.replace("__", "."), value)
+        return config
+    return _make
+
+
+@pytest.fixture(scope="session")
+def valid_python_file(tmp_path_factory):
+    """Write one small Python script per session; tests must not modify it."""
+    path = tmp_path_factory.mktemp("vpy") / "test.py"
+    path.write_text("print('test')")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def saved_config_path(tmp_path_factory):
+    """Save a customised config once per session; tests must not modify it."""
+    config = ConfigManager()
+    config.set("basic.mode", "onefile")
+    config.set("basic.input_file", "test.py")
+    path = tmp_path_factory.mktemp("cfg") / "config.json"
+    assert config.save(str(path))
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def nuitka_probe():
+    """Query Nuitka availability and version once per session."""
+    return PlatformDetector.has_nuitka(), PlatformDetector.get_nuitka_version()
+
+
+def _has_flag(command, needle):
+    """Return True if any command token contains ``needle``."""
+    return any(needle in token for token in command)
+
 
 @pytest.fixture
-def sample_config():
-    """Provide a sample configuration for testing."""
-    return {
-        "basic": {
-            "input_file": "test_app.py",
-            "mode": "standalone",
-            "output_dir": "dist",
-            "compiler": "auto",
-        },
-        "modules": {
-            "follow_imports": True,
-            "include_packages": ["numpy"],
-        },
-        "data": {
-            "package_data": [],
-            "data_files": [],
-        },
-        "platform": {
-            "windows": {
-                "console": True,
-            }
-        },
-        "advanced": {
-            "lto": "auto",
-            "jobs": "auto",
-        },
-        "output": {
-            "verbose": False,
-        }
-    }
+def has_flag():
+    """Provide the command-token search helper."""
+    return _has_flag
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Provide the QApplication shared by every Qt test."""
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+    yield app
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run tests that need a QApplication after the fast, Qt-free ones."""
+    items.sort(key=lambda item: "qapp" in getattr(item, "fixturenames", ()))
+
+    # Skip UI tests in headless environments
+    if os.environ.get("QT_QPA_PLATFORM") == "offscreen":
+        skip_headless = pytest.mark.skip(reason="UI tests skipped in headless environment")
+        for item in items:
+            if item.get_closest_marker("requires_display"):
+                item.add_marker(skip_headless)
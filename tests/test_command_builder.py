@@ -1,109 +1,95 @@
 """Tests for command builder."""
 import pytest
-from src.core.config import ConfigManager
 from src.core.command_builder import CommandBuilder
 
 
+@pytest.fixture
+def builder_config(make_config):
+    """Provide a fresh config with an input file set, ready to build."""
+    return make_config(basic__input_file="test.py")
+
+
 class TestCommandBuilder:
     """Test suite for CommandBuilder class."""
 
-    def test_init(self):
+    def test_init(self, fresh_config):
         """Test CommandBuilder initialization."""
-        config = ConfigManager()
-        builder = CommandBuilder(config)
+        builder = CommandBuilder(fresh_config)
         assert builder.config is not None
         assert builder.registry is not None
 
-    def test_build_returns_list(self):
+    def test_build_returns_list(self, builder_config):
         """Test that build returns a list of command arguments."""
-        config = ConfigManager()
-        config.set("basic.input_file", "test.py")
-        config.set("basic.mode", "standalone")
+        builder_config.set("basic.mode", "standalone")
 
-        builder = CommandBuilder(config)
+        builder = CommandBuilder(builder_config)
         command = builder.build()
 
         assert isinstance(command, list)
         assert len(command) > 0
 
-    def test_build_includes_python_module(self):
+    def test_build_includes_python_module(self, builder_config):
         """Test that build includes python -m nuitka."""
-        config = ConfigManager()
-        config.set("basic.input_file", "test.py")
-
-        builder = CommandBuilder(config)
+        builder = CommandBuilder(builder_config)
         command = builder.build()
 
         # Should contain -m and nuitka
         assert "-m" in command
         assert "nuitka" in command
 
-    def test_build_includes_mode(self):
+    def test_build_includes_mode(self, builder_config, has_flag):
         """Test that build includes compilation mode."""
-        config = ConfigManager()
-        config.set("basic.input_file", "test.py")
-        config.set("basic.mode", "onefile")
+        builder_config.set("basic.mode", "onefile")
 
-        builder = CommandBuilder(config)
+        builder = CommandBuilder(builder_config)
         command = builder.build()
 
         # Check for onefile flag
-        command_str = " ".join(command)
-        assert "onefile" in command_str.lower()
+        assert has_flag(command, "onefile")
 
-    def test_get_command_string(self):
+    def test_get_command_string(self, builder_config):
         """Test getting command as string."""
-        config = ConfigManager()
-        config.set("basic.input_file", "test.py")
-        config.set("basic.mode", "standalone")
+        builder_config.set("basic.mode", "standalone")
 
-        builder = CommandBuilder(config)
+        builder = CommandBuilder(builder_config)
         command_str = builder.get_command_string()
 
         assert isinstance(command_str, str)
         assert "nuitka" in command_str
         assert "test.py" in command_str
 
-    def test_build_with_output_dir(self):
+    def test_build_with_output_dir(self, builder_config, has_flag):
         """Test building command with output directory."""
-        config = ConfigManager()
-        config.set("basic.input_file", "test.py")
-        config.set("basic.output_dir", "dist")
+        builder_config.set("basic.output_dir", "dist")
 
-        builder = CommandBuilder(config)
-        command_str = builder.get_command_string()
+        builder = CommandBuilder(builder_config)
+        command = builder.build()
 
-        assert "dist" in command_str
+        assert has_flag(command, "dist")
 
-    def test_build_with_compiler(self):
+    def test_build_with_compiler(self, builder_config, has_flag):
         """Test building command with specific compiler."""
-        config = ConfigManager()
-        config.set("basic.input_file", "test.py")
-        config.set("basic.compiler", "mingw64")
+        builder_config.set("basic.compiler", "mingw64")
 
-        builder = CommandBuilder(config)
-        command_str = builder.get_command_string()
+        builder = CommandBuilder(builder_config)
+        command = builder.build()
 
-        assert "mingw64" in command_str.lower() or "--mingw64" in command_str
+        assert has_flag(command, "mingw64")
 
-    def test_build_with_include_packages(self):
+    def test_build_with_include_packages(self, builder_config, has_flag):
         """Test building command with included packages."""
-        config = ConfigManager()
-        config.set("basic.input_file", "test.py")
-        config.set("modules.include_packages", ["numpy", "pandas"])
+        builder_config.set("modules.include_packages", ["numpy", "pandas"])
 
-        builder = CommandBuilder(config)
-        command_str = builder.get_command_string()
+        builder = CommandBuilder(builder_config)
+        command = builder.build()
 
-        assert "numpy" in command_str or "include-package" in command_str
+        assert has_flag(command, "numpy") or has_flag(command, "include-package")
 
-    def test_build_with_follow_imports(self):
+    def test_build_with_follow_imports(self, builder_config):
         """Test building command with follow imports."""
-        config = ConfigManager()
-        config.set("basic.input_file", "test.py")
-        config.set("modules.follow_imports", True)
+        builder_config.set("modules.follow_imports", True)
 
-        builder = CommandBuilder(config)
+        builder = CommandBuilder(builder_config)
         command = builder.build()
 
         # Should work without errors
@@ -1,6 +1,5 @@
 """Tests for configuration management."""
 import json
-import tempfile
 from pathlib import Path
 import pytest
 from src.core.config import ConfigManager
@@ -17,90 +16,88 @@ class TestConfigManager:
         assert "modules" in config._config
         assert "data" in config._config
 
-    def test_get_returns_value(self):
+    def test_get_returns_value(self, fresh_config):
         """Test that get method returns values correctly."""
-        config = ConfigManager()
-        mode = config.get("basic.mode")
+        mode = fresh_config.get("basic.mode")
         assert mode == "standalone"
 
-    def test_set_updates_value(self):
+    def test_set_updates_value(self, fresh_config):
         """Test that set method updates values correctly."""
-        config = ConfigManager()
-        config.set("basic.mode", "onefile")
-        assert config.get("basic.mode") == "onefile"
+        fresh_config.set("basic.mode", "onefile")
+        assert fresh_config.get("basic.mode") == "onefile"
 
-    def test_get_nonexistent_key_returns_none(self):
+    def test_get_nonexistent_key_returns_none(self, fresh_config):
         """Test that getting non-existent key returns None."""
-        config = ConfigManager()
-        value = config.get("nonexistent.key")
+        value = fresh_config.get("nonexistent.key")
         assert value is None
 
-    def test_set_nested_key(self):
+    def test_set_nested_key(self, fresh_config):
         """Test setting nested keys."""
-        config = ConfigManager()
-        config.set("basic.input_file", "test.py")
-        assert config.get("basic.input_file") == "test.py"
+        fresh_config.set("basic.input_file", "test.py")
+        assert fresh_config.get("basic.input_file") == "test.py"
 
-    def test_to_dict(self):
+    def test_to_dict(self, fresh_config):
         """Test converting config to dictionary."""
-        config = ConfigManager()
-        config_dict = config.to_dict()
+        config_dict = fresh_config.to_dict()
         assert isinstance(config_dict, dict)
         assert "basic" in config_dict
 
-    def test_reset(self):
+    def test_reset(self, fresh_config):
         """Test resetting configuration."""
-        config = ConfigManager()
-        config.set("basic.mode", "onefile")
-        config.reset()
-        assert config.get("basic.mode") == "standalone"
-
-    def test_save_and_load(self):
-        """Test saving and loading configuration."""
-        config = ConfigManager()
-        config.set("basic.mode", "onefile")
-        config.set("basic.input_file", "test.py")
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            # Save
-            assert config.save(temp_path)
-
-            # Load into new config
-            new_config = ConfigManager()
-            assert new_config.load(temp_path)
-            assert new_config.get("basic.mode") == "onefile"
-            assert new_config.get("basic.input_file") == "test.py"
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
-
-    def test_save_creates_file(self):
+        fresh_config.set("basic.mode", "onefile")
+        fresh_config.reset()
+        assert fresh_config.get("basic.mode") == "standalone"
+
+    def test_save_and_load(self, saved_config_path):
+        """Test loading a configuration saved with custom values."""
+        new_config = ConfigManager()
+        assert new_config.load(saved_config_path)
+        assert new_config.get("basic.mode") == "onefile"
+        assert new_config.get("basic.input_file") == "test.py"
+
+    def test_save_creates_file(self, fresh_config, tmp_path):
         """Test that save creates a file."""
-        config = ConfigManager()
-        with tempfile.TemporaryDirectory() as tmpdir:
-            file_path = Path(tmpdir) / "test_config.json"
-            assert config.save(str(file_path))
-            assert file_path.exists()
+        file_path = tmp_path / "test_config.json"
+        assert fresh_config.save(str(file_path))
+        assert file_path.exists()
 
-    def test_load_invalid_file_returns_false(self):
+    def test_load_invalid_file_returns_false(self, fresh_config):
         """Test that loading invalid file returns False."""
-        config = ConfigManager()
-        assert not config.load("/nonexistent/file.json")
+        assert not fresh_config.load("/nonexistent/file.json")
 
-    def test_get_file_path(self):
+    def test_get_file_path(self, fresh_config, tmp_path):
         """Test getting current file path."""
-        config = ConfigManager()
-        assert config.get_file_path() is None
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            config.save(temp_path)
-            file_path = config.get_file_path()
-            # Handle both string and Path objects
-            assert str(file_path) == temp_path or file_path == Path(temp_path)
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        assert fresh_config.get_file_path() is None
+
+        temp_path = str(tmp_path / "config.json")
+        fresh_config.save(temp_path)
+        file_path = fresh_config.get_file_path()
+        # Handle both string and Path objects
+        assert str(file_path) == temp_path or file_path == Path(temp_path)
+
+    def test_version_tracks_changes(self, fresh_config):
+        """Test that the version only changes when a value actually changes."""
+        version = fresh_config.version
+        fresh_config.set("basic.mode", "standalone")
+        assert fresh_config.version == version
+        fresh_config.set("basic.mode", "onefile")
+        assert fresh_config.version == version + 1
+        fresh_config.reset()
+        assert fresh_config.version == version + 2
+
+    def test_update_is_a_single_change(self, fresh_config):
+        """Test that batched updates apply every value and bump the version once."""
+        version = fresh_config.version
+        assert fresh_config.update({"basic.mode": "onefile", "advanced.jobs": 4})
+        assert fresh_config.get("basic.mode") == "onefile"
+        assert fresh_config.get("advanced.jobs") == 4
+        assert fresh_config.version == version + 1
+        assert not fresh_config.update({"basic.mode": "onefile"})
+        assert fresh_config.version == version + 1
+
+    def test_snapshot_flattens_section(self, fresh_config):
+        """Test that snapshot returns values keyed by full dotted key."""
+        values = fresh_config.snapshot("platform")
+        assert values["platform.windows.console_mode"] == fresh_config.get("platform.windows.console_mode")
+        assert "platform.linux.icon" in values
+        assert fresh_config.snapshot("missing") == {}
@@ -0,0 +1,45 @@
+"""Tests for the main settings window."""
+import hashlib
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+from src.core.platform_detector import PlatformDetector
+
+
+@pytest.fixture
+def window(qtbot, monkeypatch):
+    """Create the application window without the missing-Nuitka prompt."""
+    from src.app import NuitkaGUI
+    monkeypatch.setattr(PlatformDetector, "has_nuitka", staticmethod(lambda: True))
+    window = NuitkaGUI()
+    qtbot.addWidget(window)
+    return window
+
+
+class TestArtifacts:
+    """Test suite for the artifacts table."""
+
+    def test_hashes_are_filled_in_from_the_thread_pool(self, window, qtbot, tmp_path):
+        """Test that artifact rows appear first and their hashes arrive from worker jobs."""
+        contents = {"app.bin": b"binary", "data/readme.txt": b"text"}
+        for name, data in contents.items():
+            path = tmp_path / name
+            path.parent.mkdir(exist_ok=True)
+            path.write_bytes(data)
+        window.config.set("basic.output_dir", str(tmp_path))
+        main_window = window.main_window
+        model = main_window.artifacts_model
+
+        main_window.populate_artifacts()
+        qtbot.waitUntil(lambda: model.rowCount() == len(contents))
+        qtbot.waitUntil(lambda: not main_window._hash_jobs and not main_window._hash_items)
+
+        hashes = {
+            model.item(row, 0).text().replace("\\", "/"): model.item(row, 2).text()
+            for row in range(model.rowCount())
+        }
+        assert hashes == {
+            name: hashlib.sha256(data).hexdigest()[:12] for name, data in contents.items()
+        }
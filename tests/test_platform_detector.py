@@ -1,5 +1,7 @@
 """Tests for platform detection."""
 import sys
+import threading
+import time
 import pytest
 from src.core.platform_detector import PlatformDetector
 
@@ -12,33 +14,26 @@ class TestPlatformDetector:
         platform = PlatformDetector.get_platform()
         assert platform in ["windows", "darwin", "linux"]
 
-    def test_is_windows(self):
-        """Test Windows detection."""
-        is_win = PlatformDetector.is_windows()
-        assert isinstance(is_win, bool)
-        assert is_win == (sys.platform == "win32")
-
-    def test_is_macos(self):
-        """Test macOS detection."""
-        is_mac = PlatformDetector.is_macos()
-        assert isinstance(is_mac, bool)
-        assert is_mac == (sys.platform == "darwin")
-
-    def test_is_linux(self):
-        """Test Linux detection."""
-        is_linux = PlatformDetector.is_linux()
-        assert isinstance(is_linux, bool)
-        assert is_linux == (sys.platform.startswith("linux"))
-
-    def test_has_nuitka(self):
+    @pytest.mark.parametrize("fn, expected", [
+        (PlatformDetector.is_windows, sys.platform == "win32"),
+        (PlatformDetector.is_macos, sys.platform == "darwin"),
+        (PlatformDetector.is_linux, sys.platform.startswith("linux")),
+    ], ids=["windows", "macos", "linux"])
+    def test_platform_flag(self, fn, expected):
+        """Test Windows, macOS and Linux detection."""
+        result = fn()
+        assert isinstance(result, bool)
+        assert result == expected
+
+    def test_has_nuitka(self, nuitka_probe):
         """Test Nuitka detection."""
-        has_nuitka = PlatformDetector.has_nuitka()
+        has_nuitka, _ = nuitka_probe
         assert isinstance(has_nuitka, bool)
         # Should return True or False, not error
 
-    def test_get_nuitka_version(self):
+    def test_get_nuitka_version(self, nuitka_probe):
         """Test getting Nuitka version."""
-        version = PlatformDetector.get_nuitka_version()
+        _, version = nuitka_probe
         assert isinstance(version, str)
         # Should return version string or "Not installed"
 
@@ -51,3 +46,39 @@ class TestPlatformDetector:
         ]
         # Exactly one should be True
         assert sum(platforms) == 1
+
+    def test_get_nuitka_version_is_cached(self, monkeypatch):
+        """Test that the Nuitka version is only queried once."""
+        calls = []
+
+        def fake_query():
+            calls.append(1)
+            return "1.2.3"
+
+        monkeypatch.setattr(PlatformDetector, "_cached_nuitka_version", None)
+        monkeypatch.setattr(PlatformDetector, "_query_nuitka_version", staticmethod(fake_query))
+        assert PlatformDetector.get_nuitka_version() == "1.2.3"
+        assert PlatformDetector.get_nuitka_version() == "1.2.3"
+        assert len(calls) == 1
+
+    def test_nuitka_query_runs_once_across_threads(self, monkeypatch):
+        """Test that concurrent callers share one version query."""
+        calls = []
+
+        def slow_query():
+            calls.append(threading.current_thread().name)
+            time.sleep(0.05)
+            return "1.2.3"
+
+        monkeypatch.setattr(PlatformDetector, "_cached_nuitka_version", None)
+        monkeypatch.setattr(PlatformDetector, "_query_nuitka_version", staticmethod(slow_query))
+        worker = threading.Thread(target=PlatformDetector.get_nuitka_version)
+        worker.start()
+        assert PlatformDetector.has_nuitka()
+        worker.join()
+        assert len(calls) == 1
+
+    def test_has_nuitka_reports_missing_versions(self, monkeypatch):
+        """Test that has_nuitka is False when the version query failed."""
+        monkeypatch.setattr(PlatformDetector, "_cached_nuitka_version", "Not installed")
+        assert not PlatformDetector.has_nuitka()
@@ -0,0 +1,180 @@
+"""Tests for stylesheet generation."""
+import shutil
+from functools import partial
+
+import pytest
+from src.ui import styles
+from src.ui.styles import ThemeManager, COLORS_LIGHT, COLORS_DARK
+
+
+class TestThemeManager:
+    """Test suite for ThemeManager class."""
+
+    def test_build_stylesheet_uses_palette(self):
+        """Test that generated stylesheets use the theme palette."""
+        manager = ThemeManager()
+        assert COLORS_LIGHT["accent"] in manager.build_stylesheet("light")
+        assert COLORS_DARK["accent"] in manager.build_stylesheet("dark")
+
+    def test_build_stylesheet_is_cached(self):
+        """Test that stylesheets are generated once per theme."""
+        manager = ThemeManager()
+        first = manager.build_stylesheet("dark")
+        assert manager.build_stylesheet("dark") is first
+
+    def test_template_values_are_flattened_once(self):
+        """Test that built-in palettes reuse their precomputed template values."""
+        values = styles._template_values(COLORS_DARK)
+        assert styles._template_values(COLORS_DARK) is values
+        assert values["accent"] == COLORS_DARK["accent"]
+        assert values["font_code"] == styles.FONTS["code"]
+
+    def test_observers_are_weak_and_removable(self):
+        """Test observer notification, removal and weak references."""
+        manager = ThemeManager()
+        seen = []
+
+        class Listener:
+            def on_theme(self, theme_name):
+                seen.append(theme_name)
+
+        listener = Listener()
+        manager.add_observer(listener.on_theme)
+        manager._call_observers("dark")
+        assert seen == ["dark"]
+
+        manager.remove_observer(listener.on_theme)
+        manager._call_observers("light")
+        assert seen == ["dark"]
+
+        manager.add_observer(listener.on_theme)
+        del listener
+        manager._call_observers("light")
+        assert seen == ["dark"]
+        assert not manager._observers
+
+    def test_plain_callables_are_held_strongly(self):
+        """Test that lambdas and partials stay registered after the caller drops them."""
+        manager = ThemeManager()
+        seen = []
+        manager.add_observer(lambda theme_name: seen.append(("lambda", theme_name)))
+        manager.add_observer(partial(lambda tag, theme_name: seen.append((tag, theme_name)), "partial"))
+        manager._call_observers("dark")
+        assert sorted(seen) == [("lambda", "dark"), ("partial", "dark")]
+
+        def callback(theme_name):
+            seen.append(("function", theme_name))
+
+        manager.add_observer(callback)
+        manager.remove_observer(callback)
+        seen.clear()
+        manager._call_observers("light")
+        assert ("function", "light") not in seen
+
+    def test_build_stylesheet_generates_once(self, monkeypatch):
+        """Test that repeated builds are served from the in-memory cache."""
+        manager = ThemeManager()
+        expected = manager.build_stylesheet("light", {"tabs"})
+
+        def fail(self, *args, **kwargs):
+            raise AssertionError("stylesheet should come from the in-memory cache")
+
+        monkeypatch.setattr(ThemeManager, "_generate_qss", fail)
+        assert manager.build_stylesheet("light", ["tabs"]) == expected
+
+    def test_switch_theme_skips_reapplying_same_theme(self):
+        """Test that switching to the applied theme does not restyle the app."""
+
+        class FakeApp:
+            def __init__(self):
+                self.applied = []
+                self.properties = {}
+
+            def setStyleSheet(self, stylesheet):
+                self.applied.append(stylesheet)
+
+            def property(self, name):
+                return self.properties.get(name)
+
+            def setProperty(self, name, value):
+                self.properties[name] = value
+
+        manager = ThemeManager()
+        app = FakeApp()
+        manager.switch_theme(app, "dark")
+        manager.switch_theme(app, "dark")
+        assert len(app.applied) == 1
+        manager.switch_theme(app, "dark", force=True)
+        assert len(app.applied) == 2
+        manager.switch_theme(app, "light")
+        assert len(app.applied) == 3
+        assert manager.current_theme == "light"
+
+    def test_observers_are_notified_on_next_event_loop_pass(self, qapp, qtbot):
+        """Test that observers run once the event loop picks up the batch."""
+        seen = []
+
+        class Listener:
+            def on_theme(self, theme_name):
+                seen.append(theme_name)
+
+        manager = ThemeManager()
+        listener = Listener()
+        manager.add_observer(listener.on_theme)
+        manager._notify_observers("dark")
+        assert seen == []
+        qtbot.waitUntil(lambda: seen == ["dark"])
+
+    def test_scoped_sections_follow_theme_switches(self):
+        """Test that scoped sections stay out of the app sheet and track the theme."""
+
+        class FakeWidget:
+            def setStyleSheet(self, stylesheet):
+                self.stylesheet = stylesheet
+
+            def property(self, name):
+                return None
+
+            def setProperty(self, name, value):
+                pass
+
+        manager = ThemeManager()
+        app = FakeWidget()
+        tabs = FakeWidget()
+        manager.apply_scoped_stylesheet(tabs, {"tabs"})
+        assert tabs.stylesheet == manager.build_stylesheet("light", {"tabs"})
+        manager.switch_theme(app, "dark")
+        assert "QTabBar::tab" not in app.stylesheet
+        assert tabs.stylesheet == manager.build_stylesheet("dark", {"tabs"})
+
+    def test_build_stylesheet_sections(self):
+        """Test building a stylesheet from a subset of sections."""
+        manager = ThemeManager()
+        full = manager.build_stylesheet("light")
+        partial = manager.build_stylesheet("light", sections={"text_edits", "global"})
+        assert partial.index("QMainWindow") < partial.index('QPlainTextEdit[class="console"]')
+        assert "QPushButton" not in partial
+        assert len(partial) < len(full)
+
+    def test_palettes_define_the_same_roles(self):
+        """Test that every light color role has a hand-tuned dark value."""
+        assert set(COLORS_DARK) == set(COLORS_LIGHT)
+
+    def test_theme_manager_is_shared_lazily(self):
+        """Test that the module-level theme manager is a lazy singleton."""
+        from src.ui.styles import theme_manager
+        assert isinstance(theme_manager, ThemeManager)
+        assert styles.get_theme_manager() is theme_manager
+
+    @pytest.mark.skipif(shutil.which("pyside6-rcc") is None, reason="pyside6-rcc not available")
+    def test_build_style_resources(self, tmp_path):
+        """Test baking theme stylesheets into a compiled Qt resource module."""
+        rc_module = styles.build_style_resources(tmp_path, tmp_path / "styles_rc.py")
+        assert rc_module.exists()
+        manager = ThemeManager()
+        app_sections = styles._APP_SECTIONS
+        assert (tmp_path / "dark.qss").read_text(encoding="utf-8") == manager._generate_qss(COLORS_DARK, app_sections)
+        assert (tmp_path / "dark-tabs.qss").read_text(encoding="utf-8") == manager._generate_qss(COLORS_DARK, {"tabs"})
+        qrc = (tmp_path / "styles.qrc").read_text(encoding="utf-8")
+        resource_name = styles._qss_resource_name("dark", COLORS_DARK, app_sections)
+        assert f'alias="{resource_name}"' in qrc
@@ -0,0 +1,138 @@
+"""Tests for the data-driven settings tab."""
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+from src.core.platform_detector import PlatformDetector
+from src.core.setting_definitions import load_setting_definitions
+from src.ui.tab_data_driven import DataDrivenTab
+
+
+@pytest.fixture(scope="module")
+def registry():
+    """Load the bundled setting definitions once for the module."""
+    return load_setting_definitions()
+
+
+@pytest.fixture
+def make_tab(qtbot, registry, fresh_config):
+    """Provide a factory for settings tabs owned by qtbot."""
+    def _make(tab_id):
+        tab = DataDrivenTab(None, fresh_config, registry, tab_id)
+        qtbot.addWidget(tab)
+        return tab
+    return _make
+
+
+def _tab_settings(registry, tab_id):
+    """Return the setting dicts of a tab in build order."""
+    tab = next(tab for tab in registry.get_tabs() if tab.get("id") == tab_id)
+    return [setting for section in tab.get("sections", []) for setting in section.get("settings", [])]
+
+
+def _first_setting(registry, control_type):
+    """Return (tab id, setting) for the first setting using control_type."""
+    for tab in registry.get_tabs():
+        for section in tab.get("sections", []):
+            for setting in section.get("settings", []):
+                if setting.get("control", {}).get("type") == control_type:
+                    return tab["id"], setting
+    pytest.skip(f"no {control_type} setting defined")
+
+
+class TestDataDrivenTab:
+    """Test suite for DataDrivenTab."""
+
+    def test_sections_build_on_first_show(self, make_tab, qtbot):
+        """Test that rows are built on first show, one section per event-loop pass."""
+        tab = make_tab("advanced")
+        assert not tab.is_built and not tab.rows
+
+        tab.show()
+        first_pass = len(tab.rows)
+        assert first_pass and not tab.is_built
+        qtbot.waitUntil(lambda: tab.is_built)
+        assert len(tab.rows) > first_pass
+
+    def test_ensure_built_builds_everything(self, make_tab, registry):
+        """Test that ensure_built builds every remaining row without showing the tab."""
+        tab = make_tab("output")
+        tab.ensure_built()
+        assert tab.is_built
+        assert list(tab.rows) == [setting["key"] for setting in _tab_settings(registry, "output")]
+
+    def test_rows_for_other_platforms_are_skipped(self, make_tab, registry):
+        """Test that rows constrained to other platforms are never built."""
+        platform = PlatformDetector.get_platform()
+        expected = [
+            setting["key"] for setting in _tab_settings(registry, "platform")
+            if platform in (setting.get("platform_constraints") or {}).get("os", [platform])
+        ]
+        tab = make_tab("platform")
+        tab.ensure_built()
+        assert list(tab.rows) == expected
+
+    def test_filter_applies_to_sections_built_later(self, make_tab, qtbot):
+        """Test that a search entered mid-build also filters the sections built after it."""
+        tab = make_tab("advanced")
+        tab.show()
+        first_pass = set(tab.rows)
+        tab.filter_settings("LTO")
+        qtbot.waitUntil(lambda: tab.is_built)
+
+        later = [key for key in tab.rows if key not in first_pass]
+        assert any(tab.rows[key].isHidden() for key in later)
+        for row, haystack in tab._row_list:
+            assert row.isHidden() == (haystack is not None and "lto" not in haystack)
+
+        tab.filter_settings("")
+        assert not any(row.isHidden() for row in tab.rows.values())
+
+    @pytest.mark.parametrize("control_type, pick", [
+        ("file", lambda options: "/tmp/app.py"),
+        ("directory", lambda options: "/tmp/dist"),
+        ("text", lambda options: "value"),
+        ("checkbox", lambda options: True),
+        ("combo", lambda options: options[-1]["value"]),
+        ("spin", lambda options: 3),
+        ("radio", lambda options: options[-1]["value"]),
+        ("multi_check", lambda options: [options[-1]["value"]]),
+        ("list", lambda options: ["first", "second"]),
+        ("plugin_picker", lambda options: ["anti-bloat"]),
+    ])
+    def test_set_value_round_trips(self, make_tab, registry, control_type, pick):
+        """Test that set_value followed by get_value returns the value for each control type."""
+        tab_id, setting = _first_setting(registry, control_type)
+        value = pick(setting.get("control", {}).get("options", []))
+        tab = make_tab(tab_id)
+        tab.ensure_built()
+        key = setting["key"]
+
+        tab.set_value(key, value)
+        assert tab.get_value(key) == value
+        assert tab.config.get(key) == value
+
+    def test_combo_ignores_unknown_value(self, make_tab, registry):
+        """Test that an unknown combo value leaves the current selection alone."""
+        tab_id, setting = _first_setting(registry, "combo")
+        tab = make_tab(tab_id)
+        tab.ensure_built()
+        key = setting["key"]
+        current = tab.get_value(key)
+
+        tab.set_value(key, "not-an-option")
+        assert tab.get_value(key) == current
+
+    def test_multi_check_selection_follows_option_order(self, make_tab, registry):
+        """Test that a multi-check given a list checks those options, reported in option order."""
+        tab_id, setting = _first_setting(registry, "multi_check")
+        options = [option["value"] for option in setting["control"]["options"]]
+        assert len(options) > 1
+        tab = make_tab(tab_id)
+        tab.ensure_built()
+        key = setting["key"]
+
+        tab.set_value(key, list(reversed(options)))
+        assert tab.get_value(key) == options
+        tab.set_value(key, [])
+        assert tab.get_value(key) == []
@@ -1,24 +1,18 @@
 """Basic UI tests (non-interactive)."""
 import pytest
-import os
-from PySide6.QtWidgets import QApplication
-import sys
 
+pytest.importorskip("PySide6.QtWidgets")
 
-# Skip UI tests in headless environments
-pytestmark = pytest.mark.skipif(
-    os.environ.get('QT_QPA_PLATFORM') == 'offscreen',
-    reason="UI tests skipped in headless environment"
-)
+pytestmark = pytest.mark.requires_display
 
 
 @pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    yield app
+def main_window(qapp):
+    """Create one main window shared by the read-only tests in this module."""
+    from src.app import NuitkaGUI
+    window = NuitkaGUI()
+    yield window
+    window.close()
 
 
 class TestUIBasics:
@@ -35,33 +29,24 @@ class TestUIBasics:
         except Exception as e:
             pytest.fail(f"Failed to create main window: {e}")
 
-    def test_config_manager_integration(self, qapp):
+    def test_config_manager_integration(self, main_window):
         """Test config manager integration with UI."""
-        from src.app import NuitkaGUI
-        window = NuitkaGUI()
-        assert window.config is not None
-        assert hasattr(window.config, 'get')
-        assert hasattr(window.config, 'set')
-        window.close()
+        assert main_window.config is not None
+        assert hasattr(main_window.config, 'get')
+        assert hasattr(main_window.config, 'set')
 
-    def test_menu_bar_exists(self, qapp):
+    def test_menu_bar_exists(self, main_window):
         """Test that menu bar is created."""
-        from src.app import NuitkaGUI
-        window = NuitkaGUI()
-        menubar = window.menuBar()
+        menubar = main_window.menuBar()
         assert menubar is not None
         # Check for expected menus
         actions = menubar.actions()
         assert len(actions) > 0
-        window.close()
 
-    def test_main_window_widget_exists(self, qapp):
+    def test_main_window_widget_exists(self, main_window):
         """Test that main window widget is set."""
-        from src.app import NuitkaGUI
-        window = NuitkaGUI()
-        central_widget = window.centralWidget()
+        central_widget = main_window.centralWidget()
         assert central_widget is not None
-        window.close()
 
     def test_styles_application(self, qapp):
         """Test that styles can be applied."""
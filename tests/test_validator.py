@@ -1,6 +1,4 @@
 """Tests for input validation."""
-import tempfile
-from pathlib import Path
 import pytest
 from src.core.validator import Validator
 
@@ -8,17 +6,11 @@ from src.core.validator import Validator
 class TestValidator:
     """Test suite for Validator class."""
 
-    def test_validate_file_exists_with_valid_file(self):
+    def test_validate_file_exists_with_valid_file(self, valid_python_file):
         """Test validation with an existing file."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            temp_path = f.name
-
-        try:
-            is_valid, message = Validator.validate_file_exists(temp_path)
-            assert is_valid
-            assert message == ""
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        is_valid, message = Validator.validate_file_exists(valid_python_file)
+        assert is_valid
+        assert message == ""
 
     def test_validate_file_exists_with_missing_file(self):
         """Test validation with a non-existent file."""
@@ -32,19 +24,17 @@ class TestValidator:
         assert not is_valid
         assert "required" in message
 
-    def test_validate_file_exists_with_directory(self):
+    def test_validate_file_exists_with_directory(self, tmp_path):
         """Test validation when path points to directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            is_valid, message = Validator.validate_file_exists(tmpdir)
-            assert not is_valid
-            assert "not a file" in message
+        is_valid, message = Validator.validate_file_exists(str(tmp_path))
+        assert not is_valid
+        assert "not a file" in message
 
-    def test_validate_directory_exists_with_valid_dir(self):
+    def test_validate_directory_exists_with_valid_dir(self, tmp_path):
         """Test directory validation with existing directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            is_valid, message = Validator.validate_directory_exists(tmpdir)
-            assert is_valid
-            assert message == ""
+        is_valid, message = Validator.validate_directory_exists(str(tmp_path))
+        assert is_valid
+        assert message == ""
 
     def test_validate_directory_exists_with_missing_dir(self):
         """Test directory validation with non-existent directory."""
@@ -58,55 +48,32 @@ class TestValidator:
         assert not is_valid
         assert "required" in message
 
-    def test_validate_config_with_valid_config(self):
+    def test_validate_config_with_valid_config(self, make_config, valid_python_file):
         """Test config validation with valid configuration."""
-        from src.core.config import ConfigManager
-        config = ConfigManager()
-
-        # Create a temp file for input
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write("print('test')")
-            temp_path = f.name
-
-        try:
-            config.set("basic.input_file", temp_path)
-            is_valid, messages = Validator.validate_config(config)
-            # Should be valid even if there are warning messages
-            assert is_valid or len(messages) > 0
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        config = make_config(basic__input_file=valid_python_file)
+        is_valid, messages = Validator.validate_config(config)
+        # Should be valid even if there are warning messages
+        assert is_valid or len(messages) > 0
 
-    def test_validate_config_without_input_file(self):
+    def test_validate_config_without_input_file(self, make_config):
         """Test config validation without input file."""
-        from src.core.config import ConfigManager
-        config = ConfigManager()
-        config.set("basic.input_file", "")
+        config = make_config(basic__input_file="")
 
         is_valid, messages = Validator.validate_config(config)
         assert not is_valid
         assert len(messages) > 0
 
-    def test_validate_python_file_valid(self):
+    def test_validate_python_file_valid(self, valid_python_file):
         """Test Python file validation with valid file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write("print('test')")
-            temp_path = f.name
-
-        try:
-            is_valid, message = Validator.validate_python_file(temp_path)
-            assert is_valid
-            assert message == ""
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        is_valid, message = Validator.validate_python_file(valid_python_file)
+        assert is_valid
+        assert message == ""
 
-    def test_validate_python_file_invalid_extension(self):
+    def test_validate_python_file_invalid_extension(self, tmp_path):
         """Test Python file validation with wrong extension."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            temp_path = f.name
+        temp_path = tmp_path / "test.txt"
+        temp_path.write_text("print('test')")
 
-        try:
-            is_valid, message = Validator.validate_python_file(temp_path)
-            assert not is_valid
-            assert "Python file" in message or ".py" in message
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        is_valid, message = Validator.validate_python_file(str(temp_path))
+        assert not is_valid
+        assert "Python file" in message or ".py" in message
@@ -0,0 +1,74 @@
+"""Tests for reusable widgets."""
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+from PySide6.QtCore import QItemSelectionModel
+
+from src.ui.widgets import ListBoxWithButtons, PluginPicker
+
+
+class TestListBoxWithButtons:
+    """Test suite for ListBoxWithButtons."""
+
+    def test_min_height_follows_font_changes(self, qtbot):
+        """Test that the row-based minimum height is re-measured when the font changes."""
+        listbox = ListBoxWithButtons(None, "", height=5)
+        qtbot.addWidget(listbox)
+        before = listbox.listbox.minimumHeight()
+
+        font = listbox.listbox.font()
+        font.setPointSize(font.pointSize() * 3)
+        listbox.listbox.setFont(font)
+        expected = 5 * (listbox.listbox.fontMetrics().height() + 6) + 10
+        assert listbox.listbox.minimumHeight() == expected > before
+
+
+class TestPluginPicker:
+    """Test suite for PluginPicker."""
+
+    @staticmethod
+    def _select(picker, names):
+        """Select the named plugins in the available list."""
+        selection = picker.available.selectionModel()
+        selection.clear()
+        model = picker.available_model
+        for row in range(model.rowCount()):
+            index = model.index(row, 0)
+            if index.data() in names:
+                selection.select(index, QItemSelectionModel.Select)
+
+    def test_enable_selected_skips_enabled_plugins(self, qtbot):
+        """Test that enabling adds each selected plugin once, in catalogue order."""
+        picker = PluginPicker()
+        qtbot.addWidget(picker)
+        catalogue = [picker.available_model.index(row, 0).data() for row in range(3)]
+        picker.set_items([catalogue[1]])
+
+        self._select(picker, catalogue)
+        with qtbot.waitSignal(picker.itemsChanged):
+            picker.enable_selected()
+        assert picker.get_items() == [catalogue[1], catalogue[0], catalogue[2]]
+
+        with qtbot.assertNotEmitted(picker.itemsChanged):
+            picker.enable_selected()
+        assert len(picker.get_items()) == 3
+
+    def test_disable_keeps_remaining_duplicates_enabled(self, qtbot):
+        """Test that disabling one copy of a duplicated plugin keeps the name enabled."""
+        picker = PluginPicker()
+        qtbot.addWidget(picker)
+        name = picker.available_model.index(0, 0).data()
+        picker.set_items([name, name])
+
+        picker.enabled.item(0).setSelected(True)
+        picker.disable_selected()
+        assert picker.get_items() == [name]
+        self._select(picker, [name])
+        picker.enable_selected()
+        assert picker.get_items() == [name]
+
+        picker.enabled.item(0).setSelected(True)
+        picker.disable_selected()
+        picker.enable_selected()
+        assert picker.get_items() == [name]